@@ -38,6 +38,9 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./moneytracker.db"
+    # Size of SQLAlchemy's compiled statement cache (LRU). Each combination of
+    # optional statistics filters compiles to a distinct statement shape.
+    DB_QUERY_CACHE_SIZE: int = 1200
     
     # CSV Import limits (Audit: 01_backend_action_plan.md - P0)
     MAX_IMPORT_ROWS: int = 50000  # Maximum rows per CSV import
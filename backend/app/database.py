@@ -19,6 +19,7 @@ engine = create_engine(
     echo=False,  # Set to True for SQL debugging
     future=True,
     pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # Reuse compiled SQL across requests
 )
 
 # Module logger
@@ -21,6 +21,11 @@ from app.models.category import Category
 from app.models.budget import Budget
 from app.schemas.common import ErrorResponse, StandardErrorWrapper
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional fast JSON encoder
+    orjson = None
+
 # Initialize logging explicitly (Audit: 08_backend_utils.md)
 init_logging()
 
@@ -177,9 +182,24 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down application")
 
 
+def _orjson_default(value):
+    """Fallback for types orjson can't serialize natively (Decimal, Pydantic models, ...)"""
+    if isinstance(value, Decimal):
+        return str(value)
+    return jsonable_encoder(value, custom_encoder={Decimal: lambda v: str(v) if v is not None else None})
+
+
 class CustomJSONResponse(JSONResponse):
     """Custom JSON response that properly serializes Decimal values"""
     def render(self, content: any) -> bytes:
+        # FastAPI already ran jsonable_encoder on route results, so with orjson
+        # installed serialize directly and only fall back for leftover types
+        if orjson is not None:
+            return orjson.dumps(
+                content,
+                default=_orjson_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
         # Use jsonable_encoder which respects Pydantic model serialization
         return super().render(
             jsonable_encoder(
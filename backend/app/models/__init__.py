@@ -12,6 +12,7 @@ from .import_history import ImportHistory
 from .transfer import Transfer
 from .insight import Insight, InsightGenerationLog
 from .background_job import BackgroundJob
+from .data_version import DataVersion
 
 __all__ = [
     "Account",
@@ -27,4 +28,5 @@ __all__ = [
     "Insight",
     "InsightGenerationLog",
     "BackgroundJob",
+    "DataVersion",
 ]
@@ -1,9 +1,9 @@
 """
 DataRow Model - Unveränderbare Transaktionsdaten
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Index, Date, Numeric, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Index, Date, Numeric, Text, Computed, DDL, event
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text, table, column
 from app.database import Base
 
 
@@ -31,6 +31,7 @@ class DataRow(Base):
     # Core transaction data as typed columns for performance
     transaction_date = Column(Date, nullable=False, index=True, comment="Transaction booking date (ISO format)")
     amount = Column(Numeric(12, 2), nullable=False, comment="Transaction amount (negative = expense, positive = income)")
+    amount_abs = Column(Numeric(12, 2), Computed("ABS(amount)"), comment="Generated absolute amount for percentage totals")
     recipient = Column(String(200), nullable=True, comment="Recipient or sender name")  # Index defined in __table_args__
     purpose = Column(Text, nullable=True, comment="Transaction purpose/description")
     
@@ -72,6 +73,10 @@ class DataRow(Base):
         # Account + Category for category aggregations
         Index('idx_account_category', 'account_id', 'category_id'),
         
+        # Covering index for summary/category/balance aggregations:
+        # account + date range filter, category grouping, amount sums
+        Index('idx_account_date_category_amount', 'account_id', 'transaction_date', 'category_id', 'amount', 'amount_abs'),
+        
         # Recipient lookup (for deduplication and search)
         Index('idx_recipient_search', 'recipient'),
         
@@ -80,6 +85,17 @@ class DataRow(Base):
         
         # Created timestamp for audit and recent queries
         Index('idx_created_at', 'created_at'),
+        
+        # Month buckets for balance history GROUP BY (SQLite expression indexes;
+        # the expression must match DataAggregator's strftime call exactly)
+        Index(
+            'idx_account_period_month',
+            'account_id', text("strftime('%Y-%m', transaction_date)"), 'transaction_date', 'category_id', 'amount'
+        ).ddl_if(dialect='sqlite'),
+        Index(
+            'idx_period_month',
+            text("strftime('%Y-%m', transaction_date)"), 'transaction_date', 'account_id', 'category_id', 'amount'
+        ).ddl_if(dialect='sqlite'),
     )
     
     def __repr__(self):
@@ -108,3 +124,38 @@ class DataRow(Base):
         })
         
         return result
+
+
+# ===== FULL-TEXT SEARCH (SQLite) =====
+# Trigram FTS5 index over recipient/purpose so '%term%' searches can be answered
+# from an index instead of scanning data_rows. External-content table kept in
+# sync by triggers (see migration 016); also created here for create_all setups.
+data_rows_fts = table('data_rows_fts', column('rowid'), column('recipient'), column('purpose'))
+
+_FTS_CREATE_STATEMENTS = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS data_rows_fts USING fts5(
+        recipient, purpose, content='data_rows', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS data_rows_fts_insert AFTER INSERT ON data_rows BEGIN
+        INSERT INTO data_rows_fts(rowid, recipient, purpose) VALUES (new.id, new.recipient, new.purpose);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS data_rows_fts_delete AFTER DELETE ON data_rows BEGIN
+        INSERT INTO data_rows_fts(data_rows_fts, rowid, recipient, purpose) VALUES ('delete', old.id, old.recipient, old.purpose);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS data_rows_fts_update AFTER UPDATE OF recipient, purpose ON data_rows BEGIN
+        INSERT INTO data_rows_fts(data_rows_fts, rowid, recipient, purpose) VALUES ('delete', old.id, old.recipient, old.purpose);
+        INSERT INTO data_rows_fts(rowid, recipient, purpose) VALUES (new.id, new.recipient, new.purpose);
+    END
+    """,
+)
+
+for _statement in _FTS_CREATE_STATEMENTS:
+    event.listen(DataRow.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+event.listen(DataRow.__table__, 'after_drop', DDL("DROP TABLE IF EXISTS data_rows_fts").execute_if(dialect='sqlite'))
@@ -0,0 +1,52 @@
+"""
+DataVersion Model - Global change counter for cached statistics
+"""
+from sqlalchemy import Column, Integer, CheckConstraint, DDL, event
+from app.database import Base
+
+
+# Tables whose contents feed the statistics (amounts, transfers exclusion,
+# category names, initial balances); any write to them bumps the version
+TRACKED_TABLES = ('data_rows', 'transfers', 'categories', 'accounts')
+
+
+class DataVersion(Base):
+    """
+    DataVersion Model
+
+    Single-row counter incremented by SQLite triggers on every write to the
+    tracked tables. Cached aggregates keyed on the version become stale as soon
+    as anything changes, in every worker process, without explicit invalidation.
+    """
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0, comment="Incremented on every write to a tracked table")
+
+    __table_args__ = (
+        CheckConstraint('id = 1', name='check_data_version_single_row'),
+    )
+
+    def __repr__(self):
+        return f"<DataVersion(version={self.version})>"
+
+
+def _version_trigger_statements():
+    """CREATE TRIGGER statements bumping the version on insert/update/delete"""
+    for table_name in TRACKED_TABLES:
+        for operation in ('INSERT', 'UPDATE', 'DELETE'):
+            yield (
+                f"CREATE TRIGGER IF NOT EXISTS data_version_{table_name}_{operation.lower()} "
+                f"AFTER {operation} ON {table_name} BEGIN "
+                f"UPDATE data_version SET version = version + 1 WHERE id = 1; "
+                f"END"
+            )
+
+
+# Seed the single row, then install the triggers once all tables exist
+event.listen(
+    DataVersion.__table__, 'after_create',
+    DDL("INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0)").execute_if(dialect='sqlite')
+)
+for _statement in _version_trigger_statements():
+    event.listen(Base.metadata, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
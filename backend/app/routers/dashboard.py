@@ -421,49 +421,24 @@ def get_dashboard_money_flow(
     """
     aggregator = DataAggregator(db)
     
-    # Get total income and income by category
-    income_categories = aggregator.get_category_aggregation(
+    # Summary totals and income/expense categories share the same filters,
+    # so fetch them together in a single grouped query
+    bundle = aggregator.get_dashboard_bundle(
         account_id=None,
         from_date=from_date,
         to_date=to_date,
-        limit=100,  # Get all income categories
+        limit=100,  # Get all income/expense categories
         category_id=category_id,
         category_ids=category_ids,
         min_amount=min_amount,
         max_amount=max_amount,
         recipient=recipient,
         purpose=purpose,
-        transaction_type='income'  # Only income
-    )
-    
-    # Get expense categories
-    expense_categories = aggregator.get_category_aggregation(
-        account_id=None,
-        from_date=from_date,
-        to_date=to_date,
-        limit=100,  # Get all expense categories
-        category_id=category_id,
-        category_ids=category_ids,
-        min_amount=min_amount,
-        max_amount=max_amount,
-        recipient=recipient,
-        purpose=purpose,
-        transaction_type='expense'  # Only expenses
-    )
-    
-    # Get summary for total values
-    summary = aggregator.get_summary(
-        account_id=None,
-        from_date=from_date,
-        to_date=to_date,
-        category_id=category_id,
-        category_ids=category_ids,
-        min_amount=min_amount,
-        max_amount=max_amount,
-        recipient=recipient,
-        purpose=purpose,
-        transaction_type=transaction_type
+        transaction_type=transaction_type  # Applies to summary totals only
     )
+    income_categories = bundle['income_categories']
+    expense_categories = bundle['expense_categories']
+    summary = bundle['summary']
     
     # Format income data
     income_data = []
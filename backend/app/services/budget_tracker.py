@@ -2,10 +2,10 @@
 Budget Tracker Service - Business logic for budget management and progress tracking
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, func, or_, select
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set
 
 from app.models.budget import Budget
 from app.models.category import Category
@@ -21,8 +21,11 @@ class BudgetTracker:
     
     def __init__(self, db: Session):
         self.db = db
+        # Cache transfer ids per instance; get_all_budgets_with_progress
+        # calculates progress for every budget with the same exclusions
+        self._transfer_ids: Optional[Set[int]] = None
     
-    def _get_transfer_transaction_ids(self) -> set:
+    def _get_transfer_transaction_ids(self) -> Set[int]:
         """
         Get set of all transaction IDs that are part of transfers.
         These should be excluded from budget calculations.
@@ -30,17 +33,16 @@ class BudgetTracker:
         Returns:
             Set of transaction IDs involved in transfers
         """
-        transfer_ids = set()
+        # Return cached value if available
+        if self._transfer_ids is not None:
+            return self._transfer_ids
         
-        # Get all from_transaction_ids
-        from_ids = self.db.query(Transfer.from_transaction_id).all()
-        transfer_ids.update([tid[0] for tid in from_ids])
+        # Both sides of every transfer in one Core round-trip (no ORM rows)
+        self._transfer_ids = set(self.db.execute(
+            select(Transfer.from_transaction_id).union(select(Transfer.to_transaction_id))
+        ).scalars())
         
-        # Get all to_transaction_ids
-        to_ids = self.db.query(Transfer.to_transaction_id).all()
-        transfer_ids.update([tid[0] for tid in to_ids])
-        
-        return transfer_ids
+        return self._transfer_ids
     
     def calculate_budget_progress(
         self,
@@ -151,8 +153,10 @@ class BudgetTracker:
         if not budget:
             return None
         
-        # Get category info
-        category = self.db.query(Category).filter(Category.id == budget.category_id).first()
+        # Get category info (display columns only, no ORM hydration)
+        category = self.db.query(
+            Category.name, Category.color, Category.icon
+        ).filter(Category.id == budget.category_id).first()
         
         # Calculate progress
         progress = self.calculate_budget_progress(budget, account_id)
@@ -1,18 +1,279 @@
 """
 Data Aggregator - Aggregate transaction data for statistics and charts
 """
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, and_, or_
+from sqlalchemy import select, exists, literal_column, func, case, and_, or_
+from sqlalchemy import inspect as sa_inspect
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
-from collections import defaultdict
-import calendar
+from collections import OrderedDict, namedtuple
+from functools import lru_cache, wraps
+import copy
+import heapq
+import inspect
+import threading
+import numpy as np
 
-from app.models.data_row import DataRow
+from app.models.data_row import DataRow, data_rows_fts
 from app.models.category import Category
 from app.models.transfer import Transfer
 from app.models.account import Account
+from app.models.data_version import DataVersion
+
+
+# Correlated EXISTS that is true when a data row is either side of a transfer.
+# Transfers are excluded from income/expense statistics via ~_IS_TRANSFER
+# (see DataAggregator._exclude_transfers).
+_IS_TRANSFER = exists().where(
+    or_(
+        Transfer.from_transaction_id == DataRow.id,
+        Transfer.to_transaction_id == DataRow.id
+    )
+)
+
+# Month abbreviations indexed by month number ('' at index 0); fixed English
+# names so labels don't depend on the process locale
+_MONTH_ABBR = ('', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Full month names indexed by month number ('' at index 0)
+_MONTH_NAMES = (
+    '', 'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+# Month abbreviations keyed by the zero-padded month of a 'YYYY-MM' period
+_MONTH_ABBR_BY_NUMBER = {f"{month:02d}": _MONTH_ABBR[month] for month in range(1, 13)}
+
+# Date format strings per dialect for period bucketing ('day', 'month', 'year').
+# All dialects produce the same 'YYYY-MM-DD' / 'YYYY-MM' / 'YYYY' strings.
+_PERIOD_FORMATS = {
+    'postgresql': {'day': 'YYYY-MM-DD', 'month': 'YYYY-MM', 'year': 'YYYY'},
+    'mysql': {'day': '%Y-%m-%d', 'month': '%Y-%m', 'year': '%Y'},
+    'sqlite': {'day': '%Y-%m-%d', 'month': '%Y-%m', 'year': '%Y'},
+}
+
+
+def _period_expr(dialect_name: str, column, group_by: str):
+    """
+    Build a SQL expression that buckets a date column into a period string
+    
+    Args:
+        dialect_name: SQLAlchemy dialect name of the session's bind
+        column: Date column to bucket
+        group_by: Grouping period ('day', 'month', 'year'); unknown values fall back to month
+        
+    Returns:
+        SQL expression yielding 'YYYY-MM-DD', 'YYYY-MM' or 'YYYY'
+    """
+    formats = _PERIOD_FORMATS.get(dialect_name, _PERIOD_FORMATS['sqlite'])
+    date_format = formats.get(group_by, formats['month'])
+    
+    if dialect_name == 'postgresql':
+        return func.to_char(column, date_format)
+    if dialect_name == 'mysql':
+        return func.date_format(column, date_format)
+    # Inline the (constant) format so SQLite can match the month expression index
+    return func.strftime(literal_column(f"'{date_format}'"), column)
+
+
+# Currency symbols and spaces (incl. non-breaking) stripped in a single translate pass
+_CURRENCY_TBL = str.maketrans('', '', '€$ \u00a0')
+
+
+@lru_cache(maxsize=8192, typed=False)
+def _parse_amount_cached(amount_str: str) -> float:
+    """
+    Cached parser behind DataAggregator.parse_amount.
+    
+    Bank exports repeat the same amount strings (subscriptions, rent, salary),
+    so repeated inputs are served from the LRU cache instead of re-parsed.
+    
+    Args:
+        amount_str: Non-empty amount string
+        
+    Returns:
+        Parsed amount as float
+    """
+    # Remove currency symbols and whitespace
+    amount_str = amount_str.translate(_CURRENCY_TBL).strip()
+    
+    # Whichever separator comes last is the decimal separator
+    comma = amount_str.rfind(',')
+    if comma != -1:
+        if comma > amount_str.rfind('.'):
+            # German format like "1.234,56" or "-50,00"
+            amount_str = amount_str.replace('.', '').replace(',', '.')
+        else:
+            # English format like "1,234.56" - drop thousands separators
+            amount_str = amount_str.replace(',', '')
+    
+    try:
+        return float(amount_str)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+@lru_cache(maxsize=256)
+def _parse_category_ids(category_ids: str) -> Tuple[Tuple[int, ...], bool]:
+    """
+    Parse a comma-separated category filter (e.g. "3,7,-1").
+    
+    Returns:
+        (category ids without the -1 sentinel, whether -1 = uncategorized was
+        requested); invalid input yields ((), False), which applies no filter
+    """
+    try:
+        ids = tuple(int(cid.strip()) for cid in category_ids.split(',') if cid.strip())
+    except (ValueError, AttributeError):
+        return (), False
+    return tuple(cid for cid in ids if cid != -1), -1 in ids
+
+
+@lru_cache(maxsize=1024)
+def _format_period_label_cached(start_date: date, end_date: date) -> str:
+    """
+    Cached formatter behind DataAggregator._format_period_label.
+    
+    Comparison endpoints label the same month/year boundaries on every refresh,
+    so repeated (start_date, end_date) pairs are served from the LRU cache.
+    """
+    # Pack dates as YYYYMMDD ints so each check is a couple of int compares
+    start_ymd = start_date.year * 10000 + start_date.month * 100 + start_date.day
+    end_ymd = end_date.year * 10000 + end_date.month * 100 + end_date.day
+    
+    # Check if it's a full year (Jan 1 - Dec 31 of the same year)
+    if start_ymd % 10000 == 101 and end_ymd % 10000 == 1231 and start_ymd // 10000 == end_ymd // 10000:
+        return str(start_date.year)
+    
+    # Check if it's a single month (same YYYYMM)
+    if start_ymd // 100 == end_ymd // 100:
+        return f"{_MONTH_NAMES[start_date.month]} {start_date.year}"
+    
+    # Otherwise, show date range
+    return (
+        f"{start_date.day:02d}.{start_date.month:02d}.{start_date.year} - "
+        f"{end_date.day:02d}.{end_date.month:02d}.{end_date.year}"
+    )
+
+
+# The trigram tokenizer can only use its index for terms of 3+ characters
+_FTS_MIN_TERM_LENGTH = 3
+
+
+@lru_cache(maxsize=None)
+def _has_search_index(bind) -> bool:
+    """Whether the data_rows_fts trigram index exists (checked once per engine)"""
+    return bind.dialect.name == 'sqlite' and sa_inspect(bind).has_table('data_rows_fts')
+
+
+def _text_search(column, term: str, use_index: bool):
+    """
+    Case-insensitive '%term%' match on DataRow.recipient / DataRow.purpose
+    
+    Answered from the data_rows_fts trigram index when available, otherwise
+    falls back to ILIKE (full scan).
+    """
+    if use_index and len(term) >= _FTS_MIN_TERM_LENGTH:
+        return DataRow.id.in_(
+            select(data_rows_fts.c.rowid).where(data_rows_fts.c[column.key].like(f"%{term}%"))
+        )
+    return column.ilike(f"%{term}%")
+
+
+@lru_cache(maxsize=None)
+def _has_data_version(bind) -> bool:
+    """Whether the trigger-maintained data_version table exists (checked once per engine)"""
+    return bind.dialect.name == 'sqlite' and sa_inspect(bind).has_table('data_version')
+
+
+# Cross-request LRU of get_period_comparison payloads, keyed on DataVersion
+_PERIOD_PAYLOAD_CACHE_SIZE = 256
+_period_payload_cache: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+_period_payload_lock = threading.Lock()
+
+# Cross-request LRU of _memoize'd query results (summary, categories, ...),
+# keyed on DataVersion plus the method's bound arguments
+_RESULT_CACHE_SIZE = 512
+_result_cache: 'OrderedDict[tuple, Any]' = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+# Grouped category row shape consumed by DataAggregator._build_category_list
+_CategoryRow = namedtuple(
+    '_CategoryRow',
+    ['category_id', 'category_name', 'category_color', 'category_icon', 'total_amount', 'count']
+)
+
+# Grouped recipient row shape consumed by DataAggregator._build_recipient_list
+_RecipientRow = namedtuple('_RecipientRow', ['recipient_name', 'total_amount', 'count', 'category_id'])
+
+# Recipient grouping key: blank or missing recipients are grouped as 'Unbekannt'
+_RECIPIENT_NAME = case(
+    (func.trim(func.coalesce(DataRow.recipient, '')) == '', 'Unbekannt'),
+    else_=DataRow.recipient
+)
+
+
+def _format_month_label(period: Optional[str]) -> str:
+    """Format a 'YYYY-MM' period as e.g. 'Jan 2024' (falls back to the raw period)"""
+    if period and len(period) == 7:
+        month = _MONTH_ABBR_BY_NUMBER.get(period[5:7])
+        if month:
+            return f"{month} {period[0:4]}"
+    return period or 'Unknown'
+
+
+def _format_plain_label(period: Optional[str]) -> str:
+    """Use a day/year period string as its own label"""
+    return period or 'Unknown'
+
+
+def _percent_change(old_val: float, new_val: float) -> float:
+    """Calculate percentage change for the comparison views, handling zero values"""
+    if old_val == 0:
+        return 100.0 if new_val != 0 else 0.0
+    return round(((new_val - old_val) / abs(old_val)) * 100, 2)
+
+
+def _memoize(method):
+    """
+    Cache a DataAggregator query method's result on the instance and across requests
+    
+    The key is the method name plus its fully bound arguments (defaults applied),
+    so positional and keyword calls share entries. Aggregators are created per
+    request, which keeps the first level request-scoped; on a miss, the shared
+    LRU is consulted under the current DataVersion, so identical filter sets are
+    answered without re-aggregating until any tracked table changes. Callers get
+    a deep copy so mutating a returned payload cannot corrupt the cached one.
+    """
+    signature = inspect.signature(method)
+    
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__,) + tuple(bound.arguments.values())[1:]
+        if key not in self._request_cache:
+            version = self._get_data_version()
+            shared_key = (self.db.get_bind(), version) + key
+            result = None
+            if version is not None:
+                with _result_cache_lock:
+                    if shared_key in _result_cache:
+                        _result_cache.move_to_end(shared_key)
+                        result = copy.deepcopy(_result_cache[shared_key])
+            if result is None:
+                result = method(self, *args, **kwargs)
+                if version is not None:
+                    with _result_cache_lock:
+                        _result_cache[shared_key] = copy.deepcopy(result)
+                        while len(_result_cache) > _RESULT_CACHE_SIZE:
+                            _result_cache.popitem(last=False)
+            self._request_cache[key] = result
+        return copy.deepcopy(self._request_cache[key])
+    
+    return wrapper
 
 
 class DataAggregator:
@@ -28,26 +289,30 @@ class DataAggregator:
             db: SQLAlchemy database session
         """
         self.db = db
+        # Per-request memo of query method results, see _memoize
+        self._request_cache: Dict[Tuple, Any] = {}
+        # Whether any transfer exists (looked up once, see _exclude_transfers)
+        self._has_transfers: Optional[bool] = None
     
-    def _get_transfer_transaction_ids(self) -> Set[int]:
+    def clear_cache(self) -> None:
         """
-        Get set of all transaction IDs that are part of transfers.
-        These should be excluded from income/expense calculations.
-        
-        Returns:
-            Set of transaction IDs involved in transfers
+        Drop memoized results, e.g. after writing transactions in the same request
         """
-        transfer_ids = set()
-        
-        # Get all from_transaction_ids
-        from_ids = self.db.query(Transfer.from_transaction_id).all()
-        transfer_ids.update([tid[0] for tid in from_ids])
-        
-        # Get all to_transaction_ids
-        to_ids = self.db.query(Transfer.to_transaction_id).all()
-        transfer_ids.update([tid[0] for tid in to_ids])
+        self._request_cache.clear()
+        self._has_transfers = None
+    
+    def _exclude_transfers(self, query):
+        """
+        Exclude transfer rows from a select() over DataRow
         
-        return transfer_ids
+        Most installations never record transfers; in that case the NOT EXISTS
+        probe is left out of the statement instead of running once per row.
+        """
+        if self._has_transfers is None:
+            self._has_transfers = self.db.execute(select(Transfer.id).limit(1)).first() is not None
+        if self._has_transfers:
+            query = query.where(~_IS_TRANSFER)
+        return query
     
     @staticmethod
     def parse_amount(amount_str: str) -> float:
@@ -60,28 +325,106 @@ class DataAggregator:
         Returns:
             Parsed amount as float
         """
+        # Already numeric (e.g. pandas-parsed columns): nothing to parse
+        if isinstance(amount_str, (int, float)):
+            return float(amount_str)
+        
+        # Keep the empty guard outside the cache so the sentinel is never stored
         if not amount_str:
             return 0.0
         
-        # Convert to string if not already
-        amount_str = str(amount_str).strip()
+        return _parse_amount_cached(str(amount_str))
+    
+    def _apply_common_filters(
+        self,
+        query,
+        *,
+        account_id: Optional[int] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        category_id: Optional[int] = None,
+        category_ids: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        recipient: Optional[str] = None,
+        purpose: Optional[str] = None,
+        transaction_type: Optional[str] = None,
+        uncategorized: Optional[bool] = None,
+        exclude_transfers: bool = True
+    ):
+        """
+        Apply the filter set shared by all aggregations to a select()
         
-        # Remove currency symbols and whitespace
-        amount_str = amount_str.replace('€', '').replace('$', '').strip()
+        Every aggregation goes through here so equal filters always produce the
+        same WHERE clause (and thus the same cached statement and query plan).
         
-        # Check if German format (comma as decimal separator)
-        if ',' in amount_str and '.' in amount_str:
-            # Format like "1.234,56" - remove thousands separator, replace comma
-            amount_str = amount_str.replace('.', '').replace(',', '.')
-        elif ',' in amount_str:
-            # Format like "-50,00" - replace comma with dot
-            amount_str = amount_str.replace(',', '.')
+        Args:
+            query: select() over DataRow to filter
+            uncategorized: Only uncategorized rows (takes precedence over category filters)
+            exclude_transfers: Exclude rows that are part of a transfer
+            (remaining args as in the public aggregation methods)
+            
+        Returns:
+            Filtered select()
+        """
+        if exclude_transfers:
+            query = self._exclude_transfers(query)
         
-        try:
-            return float(amount_str)
-        except (ValueError, TypeError):
-            return 0.0
+        if account_id:
+            query = query.where(DataRow.account_id == account_id)
+        
+        if from_date:
+            query = query.where(DataRow.transaction_date >= from_date)
+        
+        if to_date:
+            query = query.where(DataRow.transaction_date <= to_date)
+        
+        # Category filter: uncategorized > category_ids > category_id (-1 = uncategorized)
+        if uncategorized:
+            query = query.where(DataRow.category_id.is_(None))
+        elif category_ids:
+            cat_ids, include_uncategorized = _parse_category_ids(category_ids)
+            if include_uncategorized and cat_ids:
+                query = query.where(
+                    or_(
+                        DataRow.category_id.is_(None),
+                        DataRow.category_id.in_(cat_ids)
+                    )
+                )
+            elif include_uncategorized:
+                query = query.where(DataRow.category_id.is_(None))
+            elif cat_ids:
+                query = query.where(DataRow.category_id.in_(cat_ids))
+        elif category_id is not None:
+            if category_id == -1:
+                query = query.where(DataRow.category_id.is_(None))
+            else:
+                query = query.where(DataRow.category_id == category_id)
+        
+        # Amount range
+        if min_amount is not None:
+            query = query.where(DataRow.amount >= min_amount)
+        
+        if max_amount is not None:
+            query = query.where(DataRow.amount <= max_amount)
+        
+        # Text search
+        if recipient or purpose:
+            use_index = _has_search_index(self.db.get_bind())
+            if recipient:
+                query = query.where(_text_search(DataRow.recipient, recipient, use_index))
+            if purpose:
+                query = query.where(_text_search(DataRow.purpose, purpose, use_index))
+        
+        # Transaction type
+        if transaction_type == 'income':
+            query = query.where(DataRow.amount > 0)
+        elif transaction_type == 'expense':
+            query = query.where(DataRow.amount < 0)
+        
+        return query
     
+    @_memoize
     def get_summary(
         self,
         account_id: Optional[int] = None,
@@ -119,200 +462,60 @@ class DataAggregator:
         # Use SQL aggregation for better performance
         from sqlalchemy import case, cast, Float
         
-        # Exclude transfers from calculations
-        transfer_ids = self._get_transfer_transaction_ids()
-        
-        query = self.db.query(
+        query = select(
             func.sum(case((DataRow.amount > 0, DataRow.amount), else_=0)).label('total_income'),
             func.sum(case((DataRow.amount < 0, DataRow.amount), else_=0)).label('total_expenses'),
             func.sum(DataRow.amount).label('net_balance'),
             func.count(DataRow.id).label('transaction_count')
         )
         
-        # Exclude transfer transactions
-        if transfer_ids:
-            query = query.filter(~DataRow.id.in_(transfer_ids))
-        
-        # Apply filters
-        if account_id:
-            query = query.filter(DataRow.account_id == account_id)
-        
-        if from_date:
-            query = query.filter(DataRow.transaction_date >= from_date)
-        
-        if to_date:
-            query = query.filter(DataRow.transaction_date <= to_date)
-        
-        # Apply uncategorized filter (takes precedence over category filters)
-        if uncategorized:
-            query = query.filter(DataRow.category_id.is_(None))
-        # Apply category filter (support both single and multiple)
-        elif category_ids:
-            try:
-                cat_id_list = [int(cid.strip()) for cid in category_ids.split(',') if cid.strip()]
-                if cat_id_list:
-                    if -1 in cat_id_list:
-                        other_cats = [cid for cid in cat_id_list if cid != -1]
-                        if other_cats:
-                            query = query.filter(
-                                or_(
-                                    DataRow.category_id.is_(None),
-                                    DataRow.category_id.in_(other_cats)
-                                )
-                            )
-                        else:
-                            query = query.filter(DataRow.category_id.is_(None))
-                    else:
-                        query = query.filter(DataRow.category_id.in_(cat_id_list))
-            except (ValueError, AttributeError):
-                pass
-        elif category_id is not None:
-            if category_id == -1:
-                query = query.filter(DataRow.category_id.is_(None))
-            else:
-                query = query.filter(DataRow.category_id == category_id)
-        
-        # Apply amount filters
-        if min_amount is not None:
-            query = query.filter(DataRow.amount >= min_amount)
-        
-        if max_amount is not None:
-            query = query.filter(DataRow.amount <= max_amount)
+        query = self._apply_common_filters(
+            query,
+            account_id=account_id,
+            from_date=from_date,
+            to_date=to_date,
+            category_id=category_id,
+            category_ids=category_ids,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            recipient=recipient,
+            purpose=purpose,
+            transaction_type=transaction_type,
+            uncategorized=uncategorized
+        )
         
-        # Apply recipient filter
-        if recipient:
-            query = query.filter(DataRow.recipient.ilike(f"%{recipient}%"))
+        # Sum of transactions up to to_date (inclusive), honouring the non-date
+        # filters. Without to_date the balance runs up to the latest matching
+        # transaction, i.e. it covers every matching row, so no date bound is needed.
+        sum_up_to_q = self._apply_common_filters(
+            select(func.sum(DataRow.amount)),
+            account_id=account_id,
+            to_date=to_date,
+            category_id=category_id,
+            category_ids=category_ids,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            recipient=recipient,
+            purpose=purpose,
+            transaction_type=transaction_type
+        )
         
-        # Apply purpose filter
-        if purpose:
-            query = query.filter(DataRow.purpose.ilike(f"%{purpose}%"))
+        # Sum initial balances for accounts in scope
+        init_q = select(func.sum(Account.initial_balance))
+        if account_id:
+            init_q = init_q.where(Account.id == account_id)
         
-        # Apply transaction type filter
-        if transaction_type and transaction_type != 'all':
-            if transaction_type == 'income':
-                query = query.filter(DataRow.amount > 0)
-            elif transaction_type == 'expense':
-                query = query.filter(DataRow.amount < 0)
+        # Both sums ride along as uncorrelated scalar subqueries: one round-trip
+        query = query.add_columns(
+            sum_up_to_q.correlate(None).scalar_subquery().label('sum_up_to'),
+            init_q.scalar_subquery().label('init_sum')
+        )
         
-        # Execute query
-        result = query.first()
-        # Determine effective to_date for current balance calculation:
-        # - if `to_date` provided, use it
-        # - else if there are any transactions matching filters, use the latest transaction date
-        # - otherwise use today
-        effective_to_date = to_date
-        if not effective_to_date:
-            # find latest transaction date matching non-date filters
-            latest_q = self.db.query(func.max(DataRow.transaction_date).label('latest'))
-            # Exclude transfers
-            if transfer_ids:
-                latest_q = latest_q.filter(~DataRow.id.in_(transfer_ids))
-            if account_id:
-                latest_q = latest_q.filter(DataRow.account_id == account_id)
-            if category_ids:
-                try:
-                    cat_id_list = [int(cid.strip()) for cid in category_ids.split(',') if cid.strip()]
-                    if cat_id_list:
-                        if -1 in cat_id_list:
-                            other_cats = [cid for cid in cat_id_list if cid != -1]
-                            if other_cats:
-                                latest_q = latest_q.filter(
-                                    or_(
-                                        DataRow.category_id.is_(None),
-                                        DataRow.category_id.in_(other_cats)
-                                    )
-                                )
-                            else:
-                                latest_q = latest_q.filter(DataRow.category_id.is_(None))
-                        else:
-                            latest_q = latest_q.filter(DataRow.category_id.in_(cat_id_list))
-                except Exception:
-                    pass
-            elif category_id is not None:
-                if category_id == -1:
-                    latest_q = latest_q.filter(DataRow.category_id.is_(None))
-                else:
-                    latest_q = latest_q.filter(DataRow.category_id == category_id)
-            if min_amount is not None:
-                latest_q = latest_q.filter(DataRow.amount >= min_amount)
-            if max_amount is not None:
-                latest_q = latest_q.filter(DataRow.amount <= max_amount)
-            if recipient:
-                latest_q = latest_q.filter(DataRow.recipient.ilike(f"%{recipient}%"))
-            if purpose:
-                latest_q = latest_q.filter(DataRow.purpose.ilike(f"%{purpose}%"))
-            if transaction_type and transaction_type != 'all':
-                if transaction_type == 'income':
-                    latest_q = latest_q.filter(DataRow.amount > 0)
-                elif transaction_type == 'expense':
-                    latest_q = latest_q.filter(DataRow.amount < 0)
-
-            latest_res = latest_q.first()
-            latest_date = latest_res.latest if latest_res is not None else None
-            effective_to_date = latest_date or date.today()
-
-        # Sum of transactions up to effective_to_date (inclusive)
-        tx_q = self.db.query(func.sum(DataRow.amount).label('sum_up_to'))
-        if transfer_ids:
-            tx_q = tx_q.filter(~DataRow.id.in_(transfer_ids))
-        if account_id:
-            tx_q = tx_q.filter(DataRow.account_id == account_id)
-        # apply same category/account/recipient/purpose/amount filters
-        if category_ids:
-            try:
-                cat_id_list = [int(cid.strip()) for cid in category_ids.split(',') if cid.strip()]
-                if cat_id_list:
-                    if -1 in cat_id_list:
-                        other_cats = [cid for cid in cat_id_list if cid != -1]
-                        if other_cats:
-                            tx_q = tx_q.filter(
-                                or_(
-                                    DataRow.category_id.is_(None),
-                                    DataRow.category_id.in_(other_cats)
-                                )
-                            )
-                        else:
-                            tx_q = tx_q.filter(DataRow.category_id.is_(None))
-                    else:
-                        tx_q = tx_q.filter(DataRow.category_id.in_(cat_id_list))
-            except Exception:
-                pass
-        elif category_id is not None:
-            if category_id == -1:
-                tx_q = tx_q.filter(DataRow.category_id.is_(None))
-            else:
-                tx_q = tx_q.filter(DataRow.category_id == category_id)
-        if min_amount is not None:
-            tx_q = tx_q.filter(DataRow.amount >= min_amount)
-        if max_amount is not None:
-            tx_q = tx_q.filter(DataRow.amount <= max_amount)
-        if recipient:
-            tx_q = tx_q.filter(DataRow.recipient.ilike(f"%{recipient}%"))
-        if purpose:
-            tx_q = tx_q.filter(DataRow.purpose.ilike(f"%{purpose}%"))
-        if transaction_type and transaction_type != 'all':
-            if transaction_type == 'income':
-                tx_q = tx_q.filter(DataRow.amount > 0)
-            elif transaction_type == 'expense':
-                tx_q = tx_q.filter(DataRow.amount < 0)
-
-        # Date upper bound
-        tx_q = tx_q.filter(DataRow.transaction_date <= effective_to_date)
-        tx_res = tx_q.first()
-        sum_up_to = float(tx_res.sum_up_to or 0)
-
-        # Sum initial balances for accounts in scope
-        init_sum = 0.0
-        try:
-            init_q = self.db.query(func.sum(Account.initial_balance).label('init_sum'))
-            if account_id:
-                init_q = init_q.filter(Account.id == account_id)
-            init_res = init_q.first()
-            init_sum = float(init_res.init_sum or 0)
-        except Exception:
-            init_sum = 0.0
+        result = self.db.execute(query).first()
+        sum_up_to = float(result.sum_up_to or 0)
+        init_sum = float(result.init_sum or 0)
 
-        # current_balance = initial balances + sum of transactions up to effective_to_date
+        # current_balance = initial balances + sum of transactions up to to_date
         current_balance = round(init_sum + sum_up_to, 2)
 
         return {
@@ -322,6 +525,7 @@ class DataAggregator:
             'transaction_count': result.transaction_count or 0
         }
     
+    @_memoize
     def get_category_aggregation(
         self,
         account_id: Optional[int] = None,
@@ -359,141 +563,55 @@ class DataAggregator:
         """
         from sqlalchemy import case
         
-        # Exclude transfers from calculations
-        transfer_ids = self._get_transfer_transaction_ids()
-        
-        # Build aggregation query
-        query = self.db.query(
+        # Build aggregation query. Category details are joined in and the
+        # grand total for percentages is computed as a window over the groups,
+        # so everything comes back in a single round-trip.
+        query = select(
             DataRow.category_id,
+            Category.name.label('category_name'),
+            Category.color.label('category_color'),
+            Category.icon.label('category_icon'),
             func.sum(DataRow.amount).label('total_amount'),
-            func.count(DataRow.id).label('count')
-        )
-        
-        # Exclude transfer transactions
-        if transfer_ids:
-            query = query.filter(~DataRow.id.in_(transfer_ids))
-        
-        # Apply filters
-        if account_id:
-            query = query.filter(DataRow.account_id == account_id)
-        
-        if from_date:
-            query = query.filter(DataRow.transaction_date >= from_date)
-        
-        if to_date:
-            query = query.filter(DataRow.transaction_date <= to_date)
-        
-        # Apply category filter (when filtering specific categories in aggregation)
-        if category_ids:
-            try:
-                cat_id_list = [int(cid.strip()) for cid in category_ids.split(',') if cid.strip()]
-                if cat_id_list:
-                    if -1 in cat_id_list:
-                        other_cats = [cid for cid in cat_id_list if cid != -1]
-                        if other_cats:
-                            query = query.filter(
-                                or_(
-                                    DataRow.category_id.is_(None),
-                                    DataRow.category_id.in_(other_cats)
-                                )
-                            )
-                        else:
-                            query = query.filter(DataRow.category_id.is_(None))
-                    else:
-                        query = query.filter(DataRow.category_id.in_(cat_id_list))
-            except (ValueError, AttributeError):
-                pass
-        elif category_id is not None:
-            if category_id == -1:
-                query = query.filter(DataRow.category_id.is_(None))
-            else:
-                query = query.filter(DataRow.category_id == category_id)
-        
-        # Apply amount filters
-        if min_amount is not None:
-            query = query.filter(DataRow.amount >= min_amount)
-        
-        if max_amount is not None:
-            query = query.filter(DataRow.amount <= max_amount)
-        
-        # Apply recipient filter
-        if recipient:
-            query = query.filter(DataRow.recipient.ilike(f"%{recipient}%"))
-        
-        # Apply purpose filter
-        if purpose:
-            query = query.filter(DataRow.purpose.ilike(f"%{purpose}%"))
-        
-        # Apply transaction type filter
-        if transaction_type and transaction_type != 'all':
-            if transaction_type == 'income':
-                query = query.filter(DataRow.amount > 0)
-            elif transaction_type == 'expense':
-                query = query.filter(DataRow.amount < 0)
+            func.count(DataRow.id).label('count'),
+            func.sum(func.sum(DataRow.amount_abs)).over().label('grand_total')
+        ).outerjoin(Category, Category.id == DataRow.category_id)
         
-        # Group by category and order by absolute amount (descending)
-        query = query.group_by(DataRow.category_id)
-        query = query.order_by(func.abs(func.sum(DataRow.amount)).desc())
-        query = query.limit(limit)
-        
-        # Execute query
-        results = query.all()
+        query = self._apply_common_filters(
+            query,
+            account_id=account_id,
+            from_date=from_date,
+            to_date=to_date,
+            category_id=category_id,
+            category_ids=category_ids,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            recipient=recipient,
+            purpose=purpose,
+            transaction_type=transaction_type
+        )
         
-        # Calculate total for percentage
-        total_query = self.db.query(
-            func.sum(func.abs(DataRow.amount))
+        # Group by category
+        query = query.group_by(
+            DataRow.category_id,
+            Category.id,
+            Category.name,
+            Category.color,
+            Category.icon
         )
-        if account_id:
-            total_query = total_query.filter(DataRow.account_id == account_id)
-        if from_date:
-            total_query = total_query.filter(DataRow.transaction_date >= from_date)
-        if to_date:
-            total_query = total_query.filter(DataRow.transaction_date <= to_date)
         
-        total_absolute = float(total_query.scalar() or 0)
+        # Execute query
+        results = self.db.execute(query).all()
         
-        # Get category details
-        category_ids = [r.category_id for r in results if r.category_id]
-        categories = {c.id: c for c in self.db.query(Category).filter(Category.id.in_(category_ids)).all()}
+        # Grand total (window over all groups)
+        total_absolute = float(results[0].grand_total or 0) if results else 0.0
         
-        # Build result
-        result = []
-        for row in results:
-            category_id = row.category_id
-            
-            if category_id is None:
-                category_info = {
-                    'id': None,
-                    'name': 'Unkategorisiert',
-                    'color': '#9ca3af',
-                    'icon': '❓'
-                }
-            else:
-                category = categories.get(category_id)
-                if not category:
-                    continue
-                category_info = {
-                    'id': category.id,
-                    'name': category.name,
-                    'color': category.color,
-                    'icon': category.icon
-                }
-            
-            total_amount = float(row.total_amount or 0)
-            percentage = (abs(total_amount) / total_absolute * 100) if total_absolute > 0 else 0
-            
-            result.append({
-                'category_id': category_info['id'],
-                'category_name': category_info['name'],
-                'color': category_info['color'],
-                'icon': category_info['icon'],
-                'total_amount': round(total_amount, 2),
-                'transaction_count': row.count,
-                'percentage': round(percentage, 2)
-            })
+        # There is one row per category, so picking the top ones by absolute
+        # amount in Python is cheaper than an ORDER BY on an aggregate in SQL
+        results = heapq.nlargest(limit, results, key=lambda r: abs(r.total_amount or 0))
         
-        return result
+        return self._build_category_list(results, total_absolute)
     
+    @_memoize
     def get_recipient_aggregation(
         self,
         account_id: Optional[int] = None,
@@ -527,122 +645,88 @@ class DataAggregator:
         Returns:
             List of recipient aggregations
         """
-        # Exclude transfers from calculations
-        transfer_ids = self._get_transfer_transaction_ids()
+        recipient_name = _RECIPIENT_NAME.label('recipient_name')
         
-        query = self.db.query(DataRow)
+        # Aggregate by recipient in SQL; the grand total for percentages is a
+        # window over all groups (computed before LIMIT)
+        query = select(
+            recipient_name,
+            func.sum(DataRow.amount).label('total_amount'),
+            func.count(DataRow.id).label('count'),
+            func.min(DataRow.category_id).label('category_id'),
+            func.sum(func.sum(DataRow.amount_abs)).over().label('grand_total')
+        )
         
-        # Exclude transfer transactions
-        if transfer_ids:
-            query = query.filter(~DataRow.id.in_(transfer_ids))
+        query = self._apply_common_filters(
+            query,
+            account_id=account_id,
+            from_date=from_date,
+            to_date=to_date,
+            category_id=category_id,
+            category_ids=category_ids,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            recipient=recipient,
+            purpose=purpose,
+            transaction_type=transaction_type
+        )
         
-        # Apply filters
-        if account_id:
-            query = query.filter(DataRow.account_id == account_id)
+        # Group by recipient and order by absolute amount (descending)
+        query = query.group_by('recipient_name')
+        query = query.order_by(func.abs(func.sum(DataRow.amount)).desc())
+        query = query.limit(limit)
         
-        if from_date:
-            query = query.filter(DataRow.transaction_date >= from_date)
+        results = self.db.execute(query).all()
         
-        if to_date:
-            query = query.filter(DataRow.transaction_date <= to_date)
-        
-        # Filter by category
-        if category_ids:
-            try:
-                cat_id_list = [int(cid.strip()) for cid in category_ids.split(',') if cid.strip()]
-                if cat_id_list:
-                    if -1 in cat_id_list:
-                        other_cats = [cid for cid in cat_id_list if cid != -1]
-                        if other_cats:
-                            query = query.filter(
-                                or_(
-                                    DataRow.category_id.is_(None),
-                                    DataRow.category_id.in_(other_cats)
-                                )
-                            )
-                        else:
-                            query = query.filter(DataRow.category_id.is_(None))
-                    else:
-                        query = query.filter(DataRow.category_id.in_(cat_id_list))
-            except (ValueError, AttributeError):
-                pass
-        elif category_id is not None:
-            query = query.filter(DataRow.category_id == category_id)
+        total_absolute = float(results[0].grand_total or 0) if results else 0.0
         
-        # Apply amount filters
-        if min_amount is not None:
-            query = query.filter(DataRow.amount >= min_amount)
+        return self._build_recipient_list(results, total_absolute)
+    
+    def _build_recipient_list(
+        self,
+        rows: List[Any],
+        total_absolute: float,
+        category_names: Optional[Dict[int, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build recipient result dicts from grouped rows
         
-        if max_amount is not None:
-            query = query.filter(DataRow.amount <= max_amount)
-        
-        # Apply recipient filter
-        if recipient:
-            query = query.filter(DataRow.recipient.ilike(f"%{recipient}%"))
-        
-        # Apply purpose filter
-        if purpose:
-            query = query.filter(DataRow.purpose.ilike(f"%{purpose}%"))
-        
-        # Apply transaction type filter (before aggregation)
-        if transaction_type and transaction_type != 'all':
-            if transaction_type == 'income':
-                query = query.filter(DataRow.amount > 0)
-            elif transaction_type == 'expense':
-                query = query.filter(DataRow.amount < 0)
-        
-        # Get all transactions
-        transactions = query.all()
-        
-        # Aggregate by recipient
-        recipient_data = defaultdict(lambda: {
-            'total_amount': 0.0,
-            'count': 0,
-            'category_id': None,
-            'category_name': None
-        })
-        total_absolute = 0.0
-        
-        for transaction in transactions:
-            # Use structured fields (refactored model)
-            recipient_name = transaction.recipient or 'Unbekannt'
-            if not recipient_name.strip():
-                recipient_name = 'Unbekannt'
-            
-            amount = float(transaction.amount or 0)
-            
-            recipient_data[recipient_name]['total_amount'] += amount
-            recipient_data[recipient_name]['count'] += 1
-            total_absolute += abs(amount)
+        Args:
+            rows: Grouped rows with recipient_name, total_amount, count and category_id
+            total_absolute: Sum of absolute amounts used as percentage base
+            category_names: Pre-resolved category id -> name map (looked up if None)
             
-            # Store category info (use first occurrence)
-            if transaction.category_id and not recipient_data[recipient_name]['category_id']:
-                category = self.db.query(Category).filter(
-                    Category.id == transaction.category_id
-                ).first()
-                if category:
-                    recipient_data[recipient_name]['category_id'] = category.id
-                    recipient_data[recipient_name]['category_name'] = category.name
+        Returns:
+            List of recipient aggregations
+        """
+        if category_names is None:
+            category_names = self._get_category_names({r.category_id for r in rows if r.category_id})
         
         # Build result
         result = []
-        for recipient, data in recipient_data.items():
-            percentage = (abs(data['total_amount']) / total_absolute * 100) if total_absolute > 0 else 0
+        for row in rows:
+            total_amount = float(row.total_amount or 0)
+            percentage = (abs(total_amount) / total_absolute * 100) if total_absolute > 0 else 0
+            category_name = category_names.get(row.category_id)
             
             result.append({
-                'recipient': recipient,
-                'total_amount': round(data['total_amount'], 2),
-                'transaction_count': data['count'],
+                'recipient': row.recipient_name,
+                'total_amount': round(total_amount, 2),
+                'transaction_count': row.count,
                 'percentage': round(percentage, 2),
-                'category_id': data['category_id'],
-                'category_name': data['category_name']
+                'category_id': row.category_id if category_name is not None else None,
+                'category_name': category_name
             })
         
-        # Sort by absolute amount
-        result.sort(key=lambda x: abs(x['total_amount']), reverse=True)
-        
-        return result[:limit]
+        return result
+    
+    def _get_category_names(self, category_ids: set) -> Dict[int, str]:
+        """Resolve category names for the given ids in one query"""
+        if not category_ids:
+            return {}
+        return dict(self.db.execute(select(Category.id, Category.name).where(Category.id.in_(category_ids))).all())
     
+    @_memoize
     def get_balance_history(
         self,
         account_id: Optional[int] = None,
@@ -661,7 +745,7 @@ class DataAggregator:
         """
         Get balance history grouped by time period
         
-        REFACTORED: Uses SQL strftime for date grouping (much faster!)
+        REFACTORED: Groups by period in SQL using the dialect's date formatting function
         
         Args:
             account_id: Filter by account ID
@@ -681,213 +765,275 @@ class DataAggregator:
         """
         from sqlalchemy import case
         
-        # Exclude transfers from calculations
-        transfer_ids = self._get_transfer_transaction_ids()
+        # Bucket dates into periods in SQL (strftime / to_char / DATE_FORMAT)
+        period_col = _period_expr(self.db.get_bind().dialect.name, DataRow.transaction_date, group_by)
         
-        # Define grouping format based on group_by
-        if group_by == 'day':
-            date_format = '%Y-%m-%d'
-        elif group_by == 'year':
-            date_format = '%Y'
-        else:  # month (default)
-            date_format = '%Y-%m'
+        # Account initial balances are included so the graph starts from the
+        # real account starting value (limited to the filtered account)
+        init_q = select(func.sum(Account.initial_balance))
+        if account_id:
+            init_q = init_q.where(Account.id == account_id)
+        opening_columns = [init_q.correlate(None).scalar_subquery().label('init_sum')]
         
-        # Build aggregation query using SQL strftime
-        query = self.db.query(
-            func.strftime(date_format, DataRow.transaction_date).label('period'),
+        # Opening balance (sum of all transactions before from_date)
+        if from_date:
+            open_query = select(func.sum(DataRow.amount))
+            
+            # Same non-date filters as below, up to (excluding) from_date
+            open_query = self._apply_common_filters(
+                open_query,
+                account_id=account_id,
+                category_id=category_id,
+                category_ids=category_ids,
+                min_amount=min_amount,
+                max_amount=max_amount,
+                recipient=recipient,
+                purpose=purpose,
+                transaction_type=transaction_type
+            )
+            open_query = open_query.where(DataRow.transaction_date < from_date)
+            opening_columns.append(open_query.correlate(None).scalar_subquery().label('opening_net'))
+        
+        # Build aggregation query; the opening parts are uncorrelated scalar
+        # subqueries, evaluated once and returned on every row, so the whole
+        # history is a single round-trip
+        query = select(
+            period_col.label('period'),
             func.sum(case((DataRow.amount > 0, DataRow.amount), else_=0)).label('income'),
-            func.sum(case((DataRow.amount < 0, DataRow.amount), else_=0)).label('expenses')
+            func.sum(case((DataRow.amount < 0, DataRow.amount), else_=0)).label('expenses'),
+            *opening_columns
+        )
+        
+        query = self._apply_common_filters(
+            query,
+            account_id=account_id,
+            from_date=from_date,
+            to_date=to_date,
+            category_id=category_id,
+            category_ids=category_ids,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            recipient=recipient,
+            purpose=purpose,
+            transaction_type=transaction_type,
+            uncategorized=uncategorized
         )
         
-        # Exclude transfer transactions
-        if transfer_ids:
-            query = query.filter(~DataRow.id.in_(transfer_ids))
+        # Group by period and order chronologically
+        query = query.group_by('period').order_by('period')
         
-        # Apply filters
-        if account_id:
-            query = query.filter(DataRow.account_id == account_id)
+        # Execute query
+        results = self.db.execute(query).all()
         
-        if from_date:
-            query = query.filter(DataRow.transaction_date >= from_date)
+        # Without any period rows the opening balance is not needed
+        opening_balance = 0.0
+        if results:
+            opening_balance = float(results[0].init_sum or 0)
+            if from_date:
+                opening_balance = float(results[0].opening_net or 0) + opening_balance
+
+        # Format labels based on grouping (formatter chosen once, not per row)
+        format_label = _format_month_label if group_by == 'month' else _format_plain_label
+        labels = [format_label(row.period) for row in results]
         
-        if to_date:
-            query = query.filter(DataRow.transaction_date <= to_date)
+        period_count = len(results)
+        income_arr = np.fromiter((float(r.income or 0) for r in results), dtype=np.float64, count=period_count)
+        expenses_arr = np.fromiter((float(r.expenses or 0) for r in results), dtype=np.float64, count=period_count)
         
-        # Apply uncategorized filter (takes precedence over category filters)
-        if uncategorized:
-            query = query.filter(DataRow.category_id.is_(None))
-        # Apply category filter
-        elif category_ids:
-            try:
-                cat_id_list = [int(cid.strip()) for cid in category_ids.split(',') if cid.strip()]
-                if cat_id_list:
-                    if -1 in cat_id_list:
-                        other_cats = [cid for cid in cat_id_list if cid != -1]
-                        if other_cats:
-                            query = query.filter(
-                                or_(
-                                    DataRow.category_id.is_(None),
-                                    DataRow.category_id.in_(other_cats)
-                                )
-                            )
-                        else:
-                            query = query.filter(DataRow.category_id.is_(None))
-                    else:
-                        query = query.filter(DataRow.category_id.in_(cat_id_list))
-            except (ValueError, AttributeError):
-                pass
-        elif category_id is not None:
-            if category_id == -1:
-                query = query.filter(DataRow.category_id.is_(None))
-            else:
-                query = query.filter(DataRow.category_id == category_id)
+        # Running balance: prepend the opening balance so cumsum accumulates
+        # in the same order as a running total would
+        net = np.concatenate(([opening_balance], income_arr + expenses_arr))
+        balance = np.round(np.cumsum(net)[1:], 2).tolist()
+        income = np.round(income_arr, 2).tolist()
+        expenses = np.round(expenses_arr, 2).tolist()
         
-        # Apply amount filters
-        if min_amount is not None:
-            query = query.filter(DataRow.amount >= min_amount)
+        return {
+            'labels': labels,
+            'income': income,
+            'expenses': expenses,
+            'balance': balance
+        }
+    
+    @_memoize
+    def get_dashboard_bundle(
+        self,
+        account_id: Optional[int] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        category_ids: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        recipient: Optional[str] = None,
+        purpose: Optional[str] = None,
+        transaction_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get summary totals plus income and expense category breakdowns in one scan
         
-        if max_amount is not None:
-            query = query.filter(DataRow.amount <= max_amount)
+        Replaces calling get_summary + get_category_aggregation('income') +
+        get_category_aggregation('expense') with the same filters. A single query
+        groups by (category, direction) and the three responses are split in Python.
         
-        # Apply recipient filter
-        if recipient:
-            query = query.filter(DataRow.recipient.ilike(f"%{recipient}%"))
+        Args:
+            account_id: Filter by account ID (None for all accounts)
+            from_date: Start date filter
+            to_date: End date filter
+            limit: Maximum number of categories per direction
+            category_id: Filter by specific category ID
+            category_ids: Filter by multiple categories (comma-separated)
+            min_amount: Minimum amount filter
+            max_amount: Maximum amount filter
+            recipient: Recipient search query
+            purpose: Purpose search query
+            transaction_type: Filter applied to the summary totals ('income', 'expense', 'all');
+                the category breakdowns are always split by direction
+            
+        Returns:
+            Dictionary with 'summary' (total_income, total_expenses, transaction_count),
+            'income_categories' and 'expense_categories'
+        """
+        direction = case(
+            (DataRow.amount > 0, 1),
+            (DataRow.amount < 0, -1),
+            else_=0
+        ).label('direction')
         
-        # Apply purpose filter
-        if purpose:
-            query = query.filter(DataRow.purpose.ilike(f"%{purpose}%"))
+        query = select(
+            DataRow.category_id,
+            Category.name.label('category_name'),
+            Category.color.label('category_color'),
+            Category.icon.label('category_icon'),
+            direction,
+            func.sum(DataRow.amount).label('total_amount'),
+            func.count(DataRow.id).label('count')
+        ).outerjoin(Category, Category.id == DataRow.category_id)
         
-        # Apply transaction type filter
-        if transaction_type and transaction_type != 'all':
-            if transaction_type == 'income':
-                query = query.filter(DataRow.amount > 0)
-            elif transaction_type == 'expense':
-                query = query.filter(DataRow.amount < 0)
+        query = self._apply_common_filters(
+            query,
+            account_id=account_id,
+            from_date=from_date,
+            to_date=to_date,
+            category_id=category_id,
+            category_ids=category_ids,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            recipient=recipient,
+            purpose=purpose
+        )
         
-        # Group by period and order chronologically
-        query = query.group_by('period').order_by('period')
+        query = query.group_by(
+            DataRow.category_id,
+            Category.id,
+            Category.name,
+            Category.color,
+            Category.icon,
+            'direction'
+        )
         
-        # Execute query
-        results = query.all()
+        results = self.db.execute(query).all()
         
-        # Build response arrays
-        labels = []
-        income = []
-        expenses = []
-        balance = []
-
-        # Compute opening balance (sum of all transactions before from_date)
-        opening_balance = 0.0
-        if from_date:
-            open_query = self.db.query(
-                func.sum(DataRow.amount).label('opening_net')
-            )
-
-            # Exclude transfer transactions
-            if transfer_ids:
-                open_query = open_query.filter(~DataRow.id.in_(transfer_ids))
-
-            # Apply same non-date filters as above
-            if account_id:
-                open_query = open_query.filter(DataRow.account_id == account_id)
-
-            open_query = open_query.filter(DataRow.transaction_date < from_date)
-
-            if category_ids:
-                try:
-                    cat_id_list = [int(cid.strip()) for cid in category_ids.split(',') if cid.strip()]
-                    if cat_id_list:
-                        if -1 in cat_id_list:
-                            other_cats = [cid for cid in cat_id_list if cid != -1]
-                            if other_cats:
-                                open_query = open_query.filter(
-                                    or_(
-                                        DataRow.category_id.is_(None),
-                                        DataRow.category_id.in_(other_cats)
-                                    )
-                                )
-                            else:
-                                open_query = open_query.filter(DataRow.category_id.is_(None))
-                        else:
-                            open_query = open_query.filter(DataRow.category_id.in_(cat_id_list))
-                except (ValueError, AttributeError):
-                    pass
-            elif category_id is not None:
-                if category_id == -1:
-                    open_query = open_query.filter(DataRow.category_id.is_(None))
-                else:
-                    open_query = open_query.filter(DataRow.category_id == category_id)
-
-            # Amount filters
-            if min_amount is not None:
-                open_query = open_query.filter(DataRow.amount >= min_amount)
-
-            if max_amount is not None:
-                open_query = open_query.filter(DataRow.amount <= max_amount)
-
-            # Recipient / purpose filters
-            if recipient:
-                open_query = open_query.filter(DataRow.recipient.ilike(f"%{recipient}%"))
-
-            if purpose:
-                open_query = open_query.filter(DataRow.purpose.ilike(f"%{purpose}%"))
-
-            # Transaction type
-            if transaction_type and transaction_type != 'all':
-                if transaction_type == 'income':
-                    open_query = open_query.filter(DataRow.amount > 0)
-                elif transaction_type == 'expense':
-                    open_query = open_query.filter(DataRow.amount < 0)
-
-            opening_result = open_query.first()
-            opening_balance = float(opening_result.opening_net or 0)
-
-        # Include account initial balances into opening_balance so the graph starts
-        # from the real account starting value (if account filter applied, limit to that account)
-        try:
-            init_q = self.db.query(func.sum(Account.initial_balance).label('init_sum'))
-            if account_id:
-                init_q = init_q.filter(Account.id == account_id)
-            init_res = init_q.first()
-            init_sum = float(init_res.init_sum or 0)
-            opening_balance += init_sum
-        except Exception:
-            # If account table not available or any error occurs, keep opening_balance as-is
-            pass
-
-        cumulative = opening_balance
+        # Split grouped rows into the summary and per-direction category lists.
+        # The transaction_type filter only applies to the summary totals.
+        include_income = transaction_type in (None, 'all', 'income')
+        include_expense = transaction_type in (None, 'all', 'expense')
+        include_zero = transaction_type in (None, 'all')
+        total_income = 0.0
+        total_expenses = 0.0
+        transaction_count = 0
+        income_rows = []
+        expense_rows = []
         
         for row in results:
-            period = row.period
+            if row.direction > 0:
+                income_rows.append(row)
+                if include_income:
+                    total_income += float(row.total_amount or 0)
+                    transaction_count += row.count
+            elif row.direction < 0:
+                expense_rows.append(row)
+                if include_expense:
+                    total_expenses += float(row.total_amount or 0)
+                    transaction_count += row.count
+            elif include_zero:
+                transaction_count += row.count
+        
+        return {
+            'summary': {
+                'total_income': round(total_income, 2),
+                'total_expenses': round(total_expenses, 2),
+                'transaction_count': transaction_count
+            },
+            'income_categories': self._top_categories(income_rows, limit),
+            'expense_categories': self._top_categories(expense_rows, limit)
+        }
+    
+    def _top_categories(self, rows: List[Any], limit: int) -> List[Dict[str, Any]]:
+        """
+        Rank single-direction category rows by absolute amount and build the response
+        
+        Args:
+            rows: Grouped rows that share the same sign
+            limit: Maximum number of categories to return
             
-            # Format label based on grouping
-            if group_by == 'month' and period:
-                try:
-                    year, month = period.split('-')
-                    month_name = calendar.month_abbr[int(month)]
-                    label = f"{month_name} {year}"
-                except:
-                    label = period
-            else:
-                label = period or 'Unknown'
+        Returns:
+            List of category aggregations (same shape as get_category_aggregation)
+        """
+        # All rows share a sign, so the grand total is the sum of absolute group totals
+        total_absolute = sum(abs(float(r.total_amount or 0)) for r in rows)
+        top = heapq.nlargest(limit, rows, key=lambda r: abs(float(r.total_amount or 0)))
+        return self._build_category_list(top, total_absolute)
+    
+    @staticmethod
+    def _build_category_list(rows: List[Any], total_absolute: float) -> List[Dict[str, Any]]:
+        """
+        Build category aggregation dicts from grouped rows joined with Category
+        
+        Args:
+            rows: Rows with category_id, category_name, category_color, category_icon,
+                total_amount and count
+            total_absolute: Denominator for the percentage share
             
-            labels.append(label)
+        Returns:
+            List of category aggregations
+        """
+        result = []
+        for row in rows:
+            category_id = row.category_id
             
-            period_income = float(row.income or 0)
-            period_expenses = float(row.expenses or 0)
+            if category_id is None:
+                category_info = {
+                    'id': None,
+                    'name': 'Unkategorisiert',
+                    'color': '#9ca3af',
+                    'icon': '❓'
+                }
+            else:
+                # Skip rows pointing at a category that no longer exists
+                if row.category_name is None:
+                    continue
+                category_info = {
+                    'id': category_id,
+                    'name': row.category_name,
+                    'color': row.category_color,
+                    'icon': row.category_icon
+                }
             
-            income.append(round(period_income, 2))
-            expenses.append(round(period_expenses, 2))
+            total_amount = float(row.total_amount or 0)
+            percentage = (abs(total_amount) / total_absolute * 100) if total_absolute > 0 else 0
             
-            cumulative += period_income + period_expenses
-            balance.append(round(cumulative, 2))
+            result.append({
+                'category_id': category_info['id'],
+                'category_name': category_info['name'],
+                'color': category_info['color'],
+                'icon': category_info['icon'],
+                'total_amount': round(total_amount, 2),
+                'transaction_count': row.count,
+                'percentage': round(percentage, 2)
+            })
         
-        return {
-            'labels': labels,
-            'income': income,
-            'expenses': expenses,
-            'balance': balance
-        }
+        return result
     
     def get_period_comparison(
         self,
@@ -912,106 +1058,299 @@ class DataAggregator:
         Returns:
             Dictionary with comparison data for both periods
         """
-        # Get data for period 1
-        period1_summary = self.get_summary(
-            account_id=account_id,
-            from_date=period1_start,
-            to_date=period1_end
-        )
-        
-        period1_categories = self.get_category_aggregation(
-            account_id=account_id,
-            from_date=period1_start,
-            to_date=period1_end,
-            limit=20
-        )
-        
-        period1_recipients = self.get_recipient_aggregation(
-            account_id=account_id,
-            from_date=period1_start,
-            to_date=period1_end,
-            limit=top_limit,
-            transaction_type='all'
-        )
-        
-        # Get data for period 2
-        period2_summary = self.get_summary(
-            account_id=account_id,
-            from_date=period2_start,
-            to_date=period2_end
-        )
-        
-        period2_categories = self.get_category_aggregation(
-            account_id=account_id,
-            from_date=period2_start,
-            to_date=period2_end,
-            limit=20
-        )
-        
-        period2_recipients = self.get_recipient_aggregation(
-            account_id=account_id,
-            from_date=period2_start,
-            to_date=period2_end,
-            limit=top_limit,
-            transaction_type='all'
-        )
+        periods = [(period1_start, period1_end), (period2_start, period2_end)]
+        period1, period2 = self._get_period_payloads(account_id, periods, top_limit)
         
         # Calculate comparison metrics
-        def calculate_percent_change(old_val: float, new_val: float) -> float:
-            """Calculate percentage change, handling zero values"""
-            if old_val == 0:
-                return 100.0 if new_val != 0 else 0.0
-            return round(((new_val - old_val) / abs(old_val)) * 100, 2)
-        
         comparison = {
-            'income_diff': round(period2_summary['total_income'] - period1_summary['total_income'], 2),
-            'income_diff_percent': calculate_percent_change(
-                period1_summary['total_income'],
-                period2_summary['total_income']
+            'income_diff': round(period2['total_income'] - period1['total_income'], 2),
+            'income_diff_percent': _percent_change(
+                period1['total_income'],
+                period2['total_income']
             ),
-            'expenses_diff': round(period2_summary['total_expenses'] - period1_summary['total_expenses'], 2),
-            'expenses_diff_percent': calculate_percent_change(
-                abs(period1_summary['total_expenses']),
-                abs(period2_summary['total_expenses'])
+            'expenses_diff': round(period2['total_expenses'] - period1['total_expenses'], 2),
+            'expenses_diff_percent': _percent_change(
+                abs(period1['total_expenses']),
+                abs(period2['total_expenses'])
             ),
-            # Use current_balance (opening + net in period) when available
-            'balance_diff': round(
-                (period2_summary.get('current_balance', period2_summary.get('net_balance', 0)) -
-                 period1_summary.get('current_balance', period1_summary.get('net_balance', 0)))
-            , 2),
-            'balance_diff_percent': calculate_percent_change(
-                period1_summary.get('current_balance', period1_summary.get('net_balance', 0)),
-                period2_summary.get('current_balance', period2_summary.get('net_balance', 0))
+            # current_balance = opening + net up to the period end
+            'balance_diff': round(period2['current_balance'] - period1['current_balance'], 2),
+            'balance_diff_percent': _percent_change(
+                period1['current_balance'],
+                period2['current_balance']
             ),
-            'transaction_count_diff': period2_summary['transaction_count'] - period1_summary['transaction_count']
+            'transaction_count_diff': period2['transaction_count'] - period1['transaction_count']
         }
         
-        # Format period labels
-        period1_label = self._format_period_label(period1_start, period1_end)
-        period2_label = self._format_period_label(period2_start, period2_end)
-        
         return {
-            'period1': {
-                'period_label': period1_label,
-                'total_income': period1_summary['total_income'],
-                'total_expenses': period1_summary['total_expenses'],
-                'current_balance': period1_summary.get('current_balance', period1_summary.get('net_balance', 0)),
-                'transaction_count': period1_summary['transaction_count'],
-                'categories': period1_categories,
-                'top_recipients': period1_recipients
-            },
-            'period2': {
-                'period_label': period2_label,
-                'total_income': period2_summary['total_income'],
-                'total_expenses': period2_summary['total_expenses'],
-                'current_balance': period2_summary.get('current_balance', period2_summary.get('net_balance', 0)),
-                'transaction_count': period2_summary['transaction_count'],
-                'categories': period2_categories,
-                'top_recipients': period2_recipients
-            },
+            'period1': period1,
+            'period2': period2,
             'comparison': comparison
         }
     
+    def _get_period_payloads(
+        self,
+        account_id: int,
+        periods: List[Tuple[date, date]],
+        top_limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the per-period part of get_period_comparison, cached across requests
+        
+        Payloads are cached keyed on the DataVersion counter, so past periods are
+        reused until any transaction, transfer, category or account changes.
+        Only periods missing from the cache are computed (in one pass each for
+        summaries, categories and recipients).
+        
+        Args:
+            account_id: Account ID
+            periods: List of (start_date, end_date) tuples (inclusive)
+            top_limit: Number of top recipients per period
+            
+        Returns:
+            One payload dict per period, in the same order
+        """
+        version = self._get_data_version()
+        bind = self.db.get_bind()
+        keys = [(bind, version, account_id, start, end, top_limit) for start, end in periods]
+        payloads: List[Optional[Dict[str, Any]]] = [None] * len(periods)
+        
+        if version is not None:
+            with _period_payload_lock:
+                for i, key in enumerate(keys):
+                    cached = _period_payload_cache.get(key)
+                    if cached is not None:
+                        _period_payload_cache.move_to_end(key)
+                        payloads[i] = copy.deepcopy(cached)
+        
+        missing = [i for i, payload in enumerate(payloads) if payload is None]
+        if not missing:
+            return payloads
+        
+        missing_periods = [periods[i] for i in missing]
+        summaries = self._get_period_summaries(account_id, missing_periods)
+        categories = self._get_period_categories(account_id, missing_periods, limit=20)
+        recipients = self._get_period_recipients(account_id, missing_periods, limit=top_limit)
+        
+        for i, summary, period_categories, period_recipients in zip(missing, summaries, categories, recipients):
+            start, end = periods[i]
+            payloads[i] = {
+                'period_label': self._format_period_label(start, end),
+                'total_income': summary['total_income'],
+                'total_expenses': summary['total_expenses'],
+                'current_balance': summary['current_balance'],
+                'transaction_count': summary['transaction_count'],
+                'categories': period_categories,
+                'top_recipients': period_recipients
+            }
+        
+        if version is not None:
+            with _period_payload_lock:
+                for i in missing:
+                    _period_payload_cache[keys[i]] = copy.deepcopy(payloads[i])
+                while len(_period_payload_cache) > _PERIOD_PAYLOAD_CACHE_SIZE:
+                    _period_payload_cache.popitem(last=False)
+        
+        return payloads
+    
+    def _get_data_version(self) -> Optional[int]:
+        """
+        Current DataVersion counter, or None when results must not be cached
+        
+        Caching is skipped without the version triggers (non-SQLite or missing
+        migration) and while the session holds unflushed changes.
+        """
+        if self.db.new or self.db.dirty or self.db.deleted:
+            return None
+        if not _has_data_version(self.db.get_bind()):
+            return None
+        return self.db.execute(select(DataVersion.version).where(DataVersion.id == 1)).scalar()
+    
+    def _get_period_summaries(
+        self,
+        account_id: Optional[int],
+        periods: List[Tuple[date, date]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get get_summary-style statistics for several date ranges in one scan
+        
+        Each period contributes CASE-guarded income/expense/count sums plus the
+        running sum up to its end date (for current_balance), so all periods are
+        computed from a single pass over the account's transactions.
+        
+        Args:
+            account_id: Filter by account ID (None for all accounts)
+            periods: List of (start_date, end_date) tuples (inclusive)
+            
+        Returns:
+            One summary dict per period, in the same order, matching get_summary
+            called with account_id, from_date and to_date
+        """
+        columns = []
+        for i, (start, end) in enumerate(periods):
+            in_period = DataRow.transaction_date.between(start, end)
+            columns += [
+                func.sum(case((and_(in_period, DataRow.amount > 0), DataRow.amount), else_=0)).label(f'income_{i}'),
+                func.sum(case((and_(in_period, DataRow.amount < 0), DataRow.amount), else_=0)).label(f'expenses_{i}'),
+                func.sum(case((in_period, 1), else_=0)).label(f'count_{i}'),
+                func.sum(case((DataRow.transaction_date <= end, DataRow.amount), else_=0)).label(f'up_to_{i}')
+            ]
+        
+        # Initial balances of the accounts in scope, read in the same round-trip
+        init_q = select(func.sum(Account.initial_balance))
+        if account_id:
+            init_q = init_q.where(Account.id == account_id)
+        columns.append(init_q.correlate(None).scalar_subquery().label('init_sum'))
+        
+        query = self._exclude_transfers(select(*columns))
+        if account_id:
+            query = query.where(DataRow.account_id == account_id)
+        query = query.where(DataRow.transaction_date <= max(end for _, end in periods))
+        
+        row = self.db.execute(query).first()
+        init_sum = float(row.init_sum or 0)
+        
+        summaries = []
+        for i in range(len(periods)):
+            summaries.append({
+                'total_income': round(float(getattr(row, f'income_{i}') or 0), 2),
+                'total_expenses': round(float(getattr(row, f'expenses_{i}') or 0), 2),
+                'current_balance': round(init_sum + float(getattr(row, f'up_to_{i}') or 0), 2),
+                'transaction_count': int(getattr(row, f'count_{i}') or 0)
+            })
+        return summaries
+    
+    def _get_period_categories(
+        self,
+        account_id: Optional[int],
+        periods: List[Tuple[date, date]],
+        limit: int
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Get get_category_aggregation-style breakdowns for several date ranges in one query
+        
+        Groups by category once, with per-period CASE sums, counts and windowed
+        grand totals, then splits the rows per period in Python.
+        
+        Args:
+            account_id: Filter by account ID (None for all accounts)
+            periods: List of (start_date, end_date) tuples (inclusive)
+            limit: Maximum number of categories per period
+            
+        Returns:
+            One category list per period, in the same order, matching
+            get_category_aggregation called with account_id, from_date, to_date and limit
+        """
+        conditions = [DataRow.transaction_date.between(start, end) for start, end in periods]
+        
+        columns = []
+        for i, in_period in enumerate(conditions):
+            columns += [
+                func.sum(case((in_period, DataRow.amount), else_=0)).label(f'total_{i}'),
+                func.sum(case((in_period, 1), else_=0)).label(f'count_{i}'),
+                func.sum(func.sum(case((in_period, DataRow.amount_abs), else_=0))).over().label(f'grand_total_{i}')
+            ]
+        
+        query = select(
+            DataRow.category_id,
+            Category.name.label('category_name'),
+            Category.color.label('category_color'),
+            Category.icon.label('category_icon'),
+            *columns
+        ).outerjoin(Category, Category.id == DataRow.category_id)
+        query = self._exclude_transfers(query).where(or_(*conditions))
+        if account_id:
+            query = query.where(DataRow.account_id == account_id)
+        query = query.group_by(
+            DataRow.category_id,
+            Category.id,
+            Category.name,
+            Category.color,
+            Category.icon
+        )
+        
+        results = self.db.execute(query).all()
+        
+        period_categories = []
+        for i in range(len(periods)):
+            rows = [
+                _CategoryRow(
+                    r.category_id, r.category_name, r.category_color, r.category_icon,
+                    getattr(r, f'total_{i}'), getattr(r, f'count_{i}')
+                )
+                for r in results if getattr(r, f'count_{i}')
+            ]
+            total_absolute = float(getattr(results[0], f'grand_total_{i}') or 0) if results else 0.0
+            top = heapq.nlargest(limit, rows, key=lambda r: abs(r.total_amount or 0))
+            period_categories.append(self._build_category_list(top, total_absolute))
+        return period_categories
+    
+    def _get_period_recipients(
+        self,
+        account_id: Optional[int],
+        periods: List[Tuple[date, date]],
+        limit: int
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Get get_recipient_aggregation-style top recipients for several date ranges in one query
+        
+        Groups by recipient once, with per-period CASE sums, counts, first
+        category and windowed grand totals, then picks the top recipients per
+        period in Python.
+        
+        Args:
+            account_id: Filter by account ID (None for all accounts)
+            periods: List of (start_date, end_date) tuples (inclusive)
+            limit: Maximum number of recipients per period
+            
+        Returns:
+            One recipient list per period, in the same order, matching
+            get_recipient_aggregation called with account_id, from_date, to_date and limit
+        """
+        conditions = [DataRow.transaction_date.between(start, end) for start, end in periods]
+        
+        columns = []
+        for i, in_period in enumerate(conditions):
+            columns += [
+                func.sum(case((in_period, DataRow.amount), else_=0)).label(f'total_{i}'),
+                func.sum(case((in_period, 1), else_=0)).label(f'count_{i}'),
+                func.min(case((in_period, DataRow.category_id))).label(f'category_id_{i}'),
+                func.sum(func.sum(case((in_period, DataRow.amount_abs), else_=0))).over().label(f'grand_total_{i}')
+            ]
+        
+        query = select(_RECIPIENT_NAME.label('recipient_name'), *columns)
+        query = self._exclude_transfers(query).where(or_(*conditions))
+        if account_id:
+            query = query.where(DataRow.account_id == account_id)
+        query = query.group_by('recipient_name')
+        
+        results = self.db.execute(query).all()
+        
+        period_rows = []
+        for i in range(len(periods)):
+            rows = [
+                _RecipientRow(
+                    r.recipient_name, getattr(r, f'total_{i}'), getattr(r, f'count_{i}'),
+                    getattr(r, f'category_id_{i}')
+                )
+                for r in results if getattr(r, f'count_{i}')
+            ]
+            period_rows.append(heapq.nlargest(limit, rows, key=lambda r: abs(r.total_amount or 0)))
+        
+        # One category name lookup for all periods
+        category_names = self._get_category_names(
+            {r.category_id for rows in period_rows for r in rows if r.category_id}
+        )
+        
+        return [
+            self._build_recipient_list(
+                rows,
+                float(getattr(results[0], f'grand_total_{i}') or 0) if results else 0.0,
+                category_names
+            )
+            for i, rows in enumerate(period_rows)
+        ]
+    
     @staticmethod
     def _format_period_label(start_date: date, end_date: date) -> str:
         """
@@ -1024,20 +1363,7 @@ class DataAggregator:
         Returns:
             Formatted period label (e.g., "December 2024", "2024")
         """
-        # Check if it's a full year
-        if (start_date.month == 1 and start_date.day == 1 and
-            end_date.month == 12 and end_date.day == 31 and
-            start_date.year == end_date.year):
-            return str(start_date.year)
-        
-        # Check if it's a single month
-        if (start_date.year == end_date.year and 
-            start_date.month == end_date.month):
-            month_name = calendar.month_name[start_date.month]
-            return f"{month_name} {start_date.year}"
-        
-        # Otherwise, show date range
-        return f"{start_date.strftime('%d.%m.%Y')} - {end_date.strftime('%d.%m.%Y')}"
+        return _format_period_label_cached(start_date, end_date)
 
     def get_multi_year_comparison(
         self,
@@ -1058,24 +1384,12 @@ class DataAggregator:
         """
         years_data = []
         
-        # Collect data for each year
-        for year in years:
-            year_start = date(year, 1, 1)
-            year_end = date(year, 12, 31)
-            
-            summary = self.get_summary(
-                account_id=account_id,
-                from_date=year_start,
-                to_date=year_end
-            )
-            
-            categories = self.get_category_aggregation(
-                account_id=account_id,
-                from_date=year_start,
-                to_date=year_end,
-                limit=20
-            )
-            
+        # All years from one scan each for summaries and categories
+        periods = [(date(year, 1, 1), date(year, 12, 31)) for year in years]
+        summaries = self._get_period_summaries(account_id, periods)
+        year_categories = self._get_period_categories(account_id, periods, limit=20)
+        
+        for year, summary, categories in zip(years, summaries, year_categories):
             years_data.append({
                 'year': year,
                 'total_income': summary['total_income'],
@@ -1091,20 +1405,15 @@ class DataAggregator:
             prev_year = years_data[i-1]
             curr_year = years_data[i]
             
-            def calc_change(old_val: float, new_val: float) -> float:
-                if old_val == 0:
-                    return 100.0 if new_val != 0 else 0.0
-                return round(((new_val - old_val) / abs(old_val)) * 100, 2)
-            
             trends.append({
                 'from_year': prev_year['year'],
                 'to_year': curr_year['year'],
                 'income_change': round(curr_year['total_income'] - prev_year['total_income'], 2),
-                'income_change_percent': calc_change(prev_year['total_income'], curr_year['total_income']),
+                'income_change_percent': _percent_change(prev_year['total_income'], curr_year['total_income']),
                 'expenses_change': round(curr_year['total_expenses'] - prev_year['total_expenses'], 2),
-                'expenses_change_percent': calc_change(abs(prev_year['total_expenses']), abs(curr_year['total_expenses'])),
+                'expenses_change_percent': _percent_change(abs(prev_year['total_expenses']), abs(curr_year['total_expenses'])),
                 'balance_change': round(curr_year['net_balance'] - prev_year['net_balance'], 2),
-                'balance_change_percent': calc_change(prev_year['net_balance'], curr_year['net_balance'])
+                'balance_change_percent': _percent_change(prev_year['net_balance'], curr_year['net_balance'])
             })
         
         # Calculate overall averages
@@ -1151,28 +1460,29 @@ class DataAggregator:
             (10, 12, 'Q4')  # Oct-Dec
         ]
         
-        # Get data for each quarter
-        for start_month, end_month, quarter_label in quarter_definitions:
-            quarter_start = date(year, start_month, 1)
+        def quarter_range(quarter_year: int, start_month: int, end_month: int) -> Tuple[date, date]:
+            quarter_start = date(quarter_year, start_month, 1)
             # Last day of end_month
             if end_month == 12:
-                quarter_end = date(year, 12, 31)
+                quarter_end = date(quarter_year, 12, 31)
             else:
-                next_month = date(year, end_month + 1, 1)
+                next_month = date(quarter_year, end_month + 1, 1)
                 quarter_end = next_month - relativedelta(days=1)
-            
-            summary = self.get_summary(
-                account_id=account_id,
-                from_date=quarter_start,
-                to_date=quarter_end
-            )
-            
-            categories = self.get_category_aggregation(
-                account_id=account_id,
-                from_date=quarter_start,
-                to_date=quarter_end,
-                limit=10
-            )
+            return quarter_start, quarter_end
+        
+        # Current (and previous year's) quarters from one scan each for
+        # summaries and categories
+        periods = [quarter_range(year, start, end) for start, end, _ in quarter_definitions]
+        previous_periods = (
+            [quarter_range(year - 1, start, end) for start, end, _ in quarter_definitions]
+            if compare_to_previous_year else []
+        )
+        summaries = self._get_period_summaries(account_id, periods + previous_periods)
+        quarter_categories = self._get_period_categories(account_id, periods, limit=10)
+        
+        for i, (_, _, quarter_label) in enumerate(quarter_definitions):
+            quarter_start, quarter_end = periods[i]
+            summary = summaries[i]
             
             quarter_data = {
                 'quarter': quarter_label,
@@ -1183,28 +1493,12 @@ class DataAggregator:
                 'total_expenses': summary['total_expenses'],
                 'net_balance': summary['total_income'] + summary['total_expenses'],  # expenses are negative
                 'transaction_count': summary['transaction_count'],
-                'categories': categories
+                'categories': quarter_categories[i]
             }
             
             # Compare to previous year if requested
             if compare_to_previous_year:
-                prev_year_start = date(year - 1, start_month, 1)
-                if end_month == 12:
-                    prev_year_end = date(year - 1, 12, 31)
-                else:
-                    prev_next_month = date(year - 1, end_month + 1, 1)
-                    prev_year_end = prev_next_month - relativedelta(days=1)
-                
-                prev_summary = self.get_summary(
-                    account_id=account_id,
-                    from_date=prev_year_start,
-                    to_date=prev_year_end
-                )
-                
-                def calc_change(old_val: float, new_val: float) -> float:
-                    if old_val == 0:
-                        return 100.0 if new_val != 0 else 0.0
-                    return round(((new_val - old_val) / abs(old_val)) * 100, 2)
+                prev_summary = summaries[len(periods) + i]
                 
                 quarter_data['comparison_to_previous_year'] = {
                     'previous_year': year - 1,
@@ -1212,9 +1506,9 @@ class DataAggregator:
                     'previous_expenses': prev_summary['total_expenses'],
                     'previous_net': prev_summary['total_income'] + prev_summary['total_expenses'],  # expenses are negative
                     'income_change': round(summary['total_income'] - prev_summary['total_income'], 2),
-                    'income_change_percent': calc_change(prev_summary['total_income'], summary['total_income']),
+                    'income_change_percent': _percent_change(prev_summary['total_income'], summary['total_income']),
                     'expenses_change': round(summary['total_expenses'] - prev_summary['total_expenses'], 2),
-                    'expenses_change_percent': calc_change(abs(prev_summary['total_expenses']), abs(summary['total_expenses']))
+                    'expenses_change_percent': _percent_change(abs(prev_summary['total_expenses']), abs(summary['total_expenses']))
                 }
             
             quarters.append(quarter_data)
@@ -1225,18 +1519,13 @@ class DataAggregator:
             prev_q = quarters[i-1]
             curr_q = quarters[i]
             
-            def calc_change(old_val: float, new_val: float) -> float:
-                if old_val == 0:
-                    return 100.0 if new_val != 0 else 0.0
-                return round(((new_val - old_val) / abs(old_val)) * 100, 2)
-            
             qoq_changes.append({
                 'from_quarter': prev_q['quarter'],
                 'to_quarter': curr_q['quarter'],
                 'income_change': round(curr_q['total_income'] - prev_q['total_income'], 2),
-                'income_change_percent': calc_change(prev_q['total_income'], curr_q['total_income']),
+                'income_change_percent': _percent_change(prev_q['total_income'], curr_q['total_income']),
                 'expenses_change': round(curr_q['total_expenses'] - prev_q['total_expenses'], 2),
-                'expenses_change_percent': calc_change(abs(prev_q['total_expenses']), abs(curr_q['total_expenses']))
+                'expenses_change_percent': _percent_change(abs(prev_q['total_expenses']), abs(curr_q['total_expenses']))
             })
         
         return {
@@ -1274,7 +1563,7 @@ class DataAggregator:
         if month:
             period_start = date(year, month, 1)
             period_end = (datetime(year, month, 1) + relativedelta(months=1, days=-1)).date()
-            period_label = f"{calendar.month_name[month]} {year}"
+            period_label = f"{_MONTH_NAMES[month]} {year}"
         else:
             period_start = date(year, 1, 1)
             period_end = date(year, 12, 31)
@@ -1287,27 +1576,27 @@ class DataAggregator:
             to_date=period_end
         )
         
-        current_categories = self.get_category_aggregation(
-            account_id=account_id,
-            from_date=period_start,
-            to_date=period_end,
-            limit=50
-        )
-        
         # Calculate historical averages (all data excluding current period)
-        # Get all transactions for this account to calculate averages
-        all_transactions = self.db.query(DataRow).filter(
-            DataRow.account_id == account_id,
-            or_(
-                DataRow.transaction_date < period_start,
-                DataRow.transaction_date > period_end
-            )
-        ).all()
+        # Time range of historical data from indexed min/max lookups on either
+        # side of the period instead of loading every transaction
+        def date_bound(aggregate, condition):
+            return select(aggregate(DataRow.transaction_date)).where(
+                DataRow.account_id == account_id,
+                condition
+            ).scalar_subquery()
+        
+        before_period = DataRow.transaction_date < period_start
+        after_period = DataRow.transaction_date > period_end
+        history = self.db.execute(select(
+            func.coalesce(date_bound(func.min, before_period), date_bound(func.min, after_period)).label('min_date'),
+            func.coalesce(date_bound(func.max, after_period), date_bound(func.max, before_period)).label('max_date')
+        )).first()
+        has_history = history.min_date is not None
         
         # Calculate time range for historical data
-        if all_transactions:
-            min_date = min(t.transaction_date for t in all_transactions)
-            max_date = max(t.transaction_date for t in all_transactions)
+        if has_history:
+            min_date = history.min_date
+            max_date = history.max_date
             
             # Calculate number of periods (months or years)
             if month:
@@ -1326,10 +1615,19 @@ class DataAggregator:
                 to_date=period_start - relativedelta(days=1),
                 limit=50
             )
+            
+            # Current categories are only compared against history
+            current_categories = self.get_category_aggregation(
+                account_id=account_id,
+                from_date=period_start,
+                to_date=period_end,
+                limit=50
+            )
         else:
             # No historical data available
             num_periods = 1
             historical_categories = []
+            current_categories = []
         
         # Calculate average per period for each category
         category_benchmarks = []
@@ -1369,7 +1667,7 @@ class DataAggregator:
         total_current_expenses = abs(current_summary['total_expenses'])
         
         # Get historical overall average
-        if all_transactions:
+        if has_history:
             historical_summary = self.get_summary(
                 account_id=account_id,
                 from_date=min_date,
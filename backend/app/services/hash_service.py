@@ -8,6 +8,11 @@ from typing import Dict, Any
 from decimal import Decimal
 
 
+# json.dumps builds a new JSONEncoder on every call with non-default options;
+# one shared encoder with the same options yields byte-identical output
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
+
+
 class HashService:
     """
     Service for generating SHA256 hashes for duplicate detection.
@@ -58,11 +63,10 @@ class HashService:
         normalized = HashService._normalize_for_hash(data)
         
         # Sort keys to ensure consistent hashing
-        sorted_data = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+        sorted_data = _HASH_ENCODER.encode(normalized)
         
         # Generate SHA256 hash
-        hash_object = hashlib.sha256(sorted_data.encode('utf-8'))
-        return hash_object.hexdigest()
+        return hashlib.sha256(sorted_data.encode('utf-8')).hexdigest()
     
     @staticmethod
     def is_duplicate(hash_value: str, existing_hashes: set) -> bool:
@@ -3,7 +3,7 @@ Insights Generator Service - Generates personalized spending insights
 """
 from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, extract
+from sqlalchemy import select, func, and_, or_, extract
 from datetime import datetime, date, timedelta
 from dateutil.relativedelta import relativedelta
 from collections import defaultdict
@@ -66,31 +66,10 @@ class InsightsGenerator:
         if self._transfer_ids is not None:
             return self._transfer_ids
 
-        transfer_ids = set()
-
-        # Use DISTINCT if supported by the query object; otherwise fetch and deduplicate in Python
-        try:
-            q_from = self.db.query(Transfer.from_transaction_id)
-            if hasattr(q_from, 'distinct'):
-                from_rows = q_from.distinct().all()
-            else:
-                from_rows = q_from.all()
-        except Exception:
-            # Fallback: ensure we at least get rows or empty list
-            from_rows = []
-
-        transfer_ids.update([tid[0] for tid in from_rows if tid and tid[0]])
-
-        try:
-            q_to = self.db.query(Transfer.to_transaction_id)
-            if hasattr(q_to, 'distinct'):
-                to_rows = q_to.distinct().all()
-            else:
-                to_rows = q_to.all()
-        except Exception:
-            to_rows = []
-
-        transfer_ids.update([tid[0] for tid in to_rows if tid and tid[0]])
+        # Both sides of every transfer in one Core round-trip (no ORM rows)
+        transfer_ids = set(self.db.execute(
+            select(Transfer.from_transaction_id).union(select(Transfer.to_transaction_id))
+        ).scalars())
 
         self._transfer_ids = transfer_ids
         return transfer_ids
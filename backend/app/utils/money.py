@@ -3,13 +3,20 @@ Money handling utilities for precise decimal operations.
 Audit reference: 01_backend_action_plan.md - P0 Money precision
 """
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Union, Optional
 import json
+import re
 
 
 # Standard quantization for currency (2 decimal places)
 CURRENCY_QUANTIZE = Decimal('0.01')
 
+# Malformed-amount patterns used by normalize_amount (compiled once, the
+# function runs for every amount and saldo cell during CSV import)
+_EXTRA_ZEROS_PATTERN = re.compile(r'^(-?\d+)\.0+(\d+)$')
+_MIXED_SEPARATOR_PATTERN = re.compile(r'^(-?\d+)[.,]0[.,](\d{1,2})$')
+
 
 def to_decimal(value: Union[str, int, float, Decimal, None]) -> Optional[Decimal]:
     """
@@ -144,7 +151,17 @@ def normalize_amount(value: Union[str, int, float], german_format: bool = False)
     if isinstance(value, (int, float, Decimal)):
         return to_decimal(value)
         
-    value_str = str(value).strip()
+    return _normalize_amount_str(str(value), german_format)
+
+
+@lru_cache(maxsize=8192)
+def _normalize_amount_str(value_str: str, german_format: bool) -> Decimal:
+    """
+    String path of normalize_amount, memoized per (string, format).
+    Bank exports repeat the same amounts (rent, subscriptions, fees) many
+    times; Decimal results are immutable, so cached values can be shared.
+    """
+    value_str = value_str.strip()
     
     # Remove currency symbols
     value_str = value_str.replace('EUR', '').replace('€', '').replace('$', '').replace('USD', '').strip()
@@ -155,11 +172,9 @@ def normalize_amount(value: Union[str, int, float], german_format: bool = False)
     # Pattern 3: "0.000001" or "64.000008" (should be "0.01" or "64.08")
     # This appears when thousand separators are incorrectly replaced or when decimals have too many zeros
     
-    import re
-    
     # First, handle cases with extraneous zeros in decimal part: X.00000Y → X.0Y
     # e.g., "0.000001" → "0.01", "-64.000008" → "-64.08"
-    match_zeros = re.match(r'^(-?\d+)\.0+(\d+)$', value_str)
+    match_zeros = _EXTRA_ZEROS_PATTERN.match(value_str)
     if match_zeros:
         integer_part = match_zeros.group(1)
         decimal_part = match_zeros.group(2)
@@ -175,7 +190,7 @@ def normalize_amount(value: Union[str, int, float], german_format: bool = False)
     # e.g., "146.0,47" → "146.47", "0.0,62" → "0.62"
     elif '.0,' in value_str or ',0,' in value_str:
         # Match: digits, then (.0, or ,0,), then 1-2 digits
-        match = re.match(r'^(-?\d+)[.,]0[.,](\d{1,2})$', value_str)
+        match = _MIXED_SEPARATOR_PATTERN.match(value_str)
         if match:
             integer_part = match.group(1)
             decimal_part = match.group(2).zfill(2)  # Pad to 2 digits
@@ -0,0 +1,20 @@
+-- Migration: Add Covering Index for Aggregations
+-- Version: 013
+-- Description: Adds a composite index on data_rows that covers the columns read by
+--              the statistics aggregations (account/date filters, category grouping, amount sums)
+-- Author: System
+-- Date: 2026-10-16
+
+-- =====================================================
+-- COVERING INDEX FOR AGGREGATION QUERIES
+-- =====================================================
+-- Summary, category and balance-history aggregations filter on account_id and a
+-- transaction_date range, group by category_id and sum amount. With all four columns
+-- in the index (and id as the implicit rowid), SQLite answers these queries from the
+-- index alone without visiting the table rows.
+CREATE INDEX IF NOT EXISTS idx_account_date_category_amount
+    ON data_rows(account_id, transaction_date, category_id, amount);
+
+-- PostgreSQL equivalent (index-only scans):
+-- CREATE INDEX IF NOT EXISTS idx_account_date_category_amount
+--     ON data_rows(account_id, transaction_date, category_id) INCLUDE (amount);
@@ -0,0 +1,22 @@
+-- Migration: Add Generated amount_abs Column to Data Rows
+-- Version: 014
+-- Description: Adds a generated ABS(amount) column and folds it into the aggregation covering index
+-- Author: System
+-- Date: 2026-10-16
+
+-- =====================================================
+-- ADD AMOUNT_ABS GENERATED COLUMN
+-- =====================================================
+-- Absolute transaction amount, used for percentage totals (SUM(amount_abs)).
+-- SQLite only allows VIRTUAL generated columns via ALTER TABLE; the value is
+-- materialized in the covering index below, so aggregations stay index-only.
+ALTER TABLE data_rows ADD COLUMN amount_abs DECIMAL(12, 2) GENERATED ALWAYS AS (ABS(amount)) VIRTUAL;
+
+-- =====================================================
+-- REBUILD COVERING INDEX WITH AMOUNT_ABS
+-- =====================================================
+-- A virtual column outside the index would force a table lookup per row,
+-- so it is appended to the covering index from migration 013.
+DROP INDEX IF EXISTS idx_account_date_category_amount;
+CREATE INDEX IF NOT EXISTS idx_account_date_category_amount
+    ON data_rows(account_id, transaction_date, category_id, amount, amount_abs);
@@ -0,0 +1,22 @@
+-- Migration: Add Month-Bucket Expression Indexes to Data Rows
+-- Version: 015
+-- Description: Indexes strftime('%Y-%m', transaction_date) so monthly balance history
+--              can group by walking an index instead of sorting in a temp B-tree
+-- Author: System
+-- Date: 2026-10-16
+
+-- =====================================================
+-- MONTH-BUCKET EXPRESSION INDEXES
+-- =====================================================
+-- Balance history groups by strftime('%Y-%m', transaction_date). SQLite only matches
+-- an expression index when the query uses the identical expression, so the
+-- aggregator renders the format string inline rather than as a bound parameter.
+-- Trailing columns make both indexes covering for the unfiltered history query.
+
+-- Single-account history (account page)
+CREATE INDEX IF NOT EXISTS idx_account_period_month
+    ON data_rows(account_id, strftime('%Y-%m', transaction_date), transaction_date, category_id, amount);
+
+-- All-accounts history (dashboard)
+CREATE INDEX IF NOT EXISTS idx_period_month
+    ON data_rows(strftime('%Y-%m', transaction_date), transaction_date, account_id, category_id, amount);
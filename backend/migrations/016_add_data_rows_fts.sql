@@ -0,0 +1,40 @@
+-- Migration: Add Trigram Full-Text Search Index for Recipient/Purpose
+-- Version: 016
+-- Description: FTS5 trigram index so '%term%' recipient/purpose searches use an index
+--              instead of scanning data_rows (requires SQLite 3.34+)
+-- Author: System
+-- Date: 2026-10-16
+
+-- =====================================================
+-- FTS5 TABLE
+-- =====================================================
+-- External-content table: stores only the trigram index, the text itself is
+-- read from data_rows. The trigram tokenizer answers LIKE '%term%' (case-
+-- insensitive) for terms of at least 3 characters.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS data_rows_fts USING fts5(
+    recipient, purpose, content='data_rows', content_rowid='id', tokenize='trigram'
+);
+
+-- =====================================================
+-- SYNC TRIGGERS
+-- =====================================================
+
+CREATE TRIGGER IF NOT EXISTS data_rows_fts_insert AFTER INSERT ON data_rows BEGIN
+    INSERT INTO data_rows_fts(rowid, recipient, purpose) VALUES (new.id, new.recipient, new.purpose);
+END;
+
+CREATE TRIGGER IF NOT EXISTS data_rows_fts_delete AFTER DELETE ON data_rows BEGIN
+    INSERT INTO data_rows_fts(data_rows_fts, rowid, recipient, purpose) VALUES ('delete', old.id, old.recipient, old.purpose);
+END;
+
+CREATE TRIGGER IF NOT EXISTS data_rows_fts_update AFTER UPDATE OF recipient, purpose ON data_rows BEGIN
+    INSERT INTO data_rows_fts(data_rows_fts, rowid, recipient, purpose) VALUES ('delete', old.id, old.recipient, old.purpose);
+    INSERT INTO data_rows_fts(rowid, recipient, purpose) VALUES (new.id, new.recipient, new.purpose);
+END;
+
+-- =====================================================
+-- BACKFILL
+-- =====================================================
+
+INSERT INTO data_rows_fts(data_rows_fts) VALUES ('rebuild');
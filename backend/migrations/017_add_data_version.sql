@@ -0,0 +1,67 @@
+-- Migration: Add Data Version Counter
+-- Version: 017
+-- Description: Single-row counter bumped by triggers on every write to tables that
+--              feed statistics; cached aggregates are keyed on it
+-- Author: System
+-- Date: 2026-10-16
+
+-- =====================================================
+-- DATA VERSION TABLE
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS data_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0);
+
+-- =====================================================
+-- VERSION TRIGGERS
+-- =====================================================
+-- Any insert/update/delete on data_rows, transfers, categories or accounts
+-- invalidates cached statistics in every worker process.
+
+-- data_rows
+CREATE TRIGGER IF NOT EXISTS data_version_data_rows_insert AFTER INSERT ON data_rows BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS data_version_data_rows_update AFTER UPDATE ON data_rows BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS data_version_data_rows_delete AFTER DELETE ON data_rows BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+
+-- transfers
+CREATE TRIGGER IF NOT EXISTS data_version_transfers_insert AFTER INSERT ON transfers BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS data_version_transfers_update AFTER UPDATE ON transfers BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS data_version_transfers_delete AFTER DELETE ON transfers BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+
+-- categories
+CREATE TRIGGER IF NOT EXISTS data_version_categories_insert AFTER INSERT ON categories BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS data_version_categories_update AFTER UPDATE ON categories BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS data_version_categories_delete AFTER DELETE ON categories BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+
+-- accounts
+CREATE TRIGGER IF NOT EXISTS data_version_accounts_insert AFTER INSERT ON accounts BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS data_version_accounts_update AFTER UPDATE ON accounts BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS data_version_accounts_delete AFTER DELETE ON accounts BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;